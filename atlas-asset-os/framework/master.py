@@ -1,5 +1,6 @@
 """BasePlate OS Master - Core OS manager for asset operating systems."""
 
+import atexit
 import sys
 import threading
 import time
@@ -153,14 +154,27 @@ class OSManager:
             LOGGER.error(f"Failed to start modules: {e}")
             sys.exit(1)
 
-    def run(self):
-        """Run the OS main loop."""
+    def boot(self) -> None:
+        """
+        Start all modules and announce boot completion.
+
+        Returns once every module has been started and ``os.boot_complete``
+        has been published, so callers can inspect a fully booted OS on the
+        current thread. A non-exiting teardown is registered with ``atexit``
+        in case the caller never reaches an explicit ``shutdown()``.
+        """
         LOGGER.info("BasePlate OS booting...")
 
         self._start_modules()
+        atexit.register(self._teardown)
 
         self.bus.publish("os.boot_complete", {"ts": time.time()})
-        LOGGER.info("Boot sequence complete. Entering main loop.")
+        LOGGER.info("Boot sequence complete.")
+
+    def run(self):
+        """Run the OS main loop."""
+        self.boot()
+        LOGGER.info("Entering main loop.")
 
         # Main loop
         try:
@@ -172,6 +186,15 @@ class OSManager:
     def shutdown(self, signum=None, frame=None):
         """Shutdown the OS gracefully."""
         LOGGER.info("Shutdown signal received")
+        self._teardown()
+        # Only call sys.exit if we're in the main thread AND not running under pytest
+        # This prevents "Exception ignored in thread" warnings during test cleanup
+        if not is_test_env() and threading.current_thread() is threading.main_thread():
+            sys.exit(0)
+
+    def _teardown(self) -> None:
+        """Stop modules and the bus without exiting; also the atexit hook."""
+        atexit.unregister(self._teardown)
         self.running = False
         self.bus.publish("os.shutdown", {})
 
@@ -180,10 +203,6 @@ class OSManager:
 
         self.bus.shutdown()
         LOGGER.info("OS Halted.")
-        # Only call sys.exit if we're in the main thread AND not running under pytest
-        # This prevents "Exception ignored in thread" warnings during test cleanup
-        if not is_test_env() and threading.current_thread() is threading.main_thread():
-            sys.exit(0)
 
     def _handle_system_check_request(self, data: Optional[Dict[str, Any]]) -> None:
         """
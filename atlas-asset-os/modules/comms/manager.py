@@ -1,6 +1,7 @@
 import json
 import logging
 import os
+import queue
 import threading
 import time
 from collections import deque
@@ -16,6 +17,36 @@ from modules.comms.types import MeshtasticClient
 LOGGER = logging.getLogger("modules.comms")
 
 
+class WifiPollingPolicy:
+    """Back-off schedule for WiFi health checks.
+
+    Each healthy check stretches the interval one step (default, then
+    no-change, then two-no-change); any failed check resets it.
+    """
+
+    def __init__(
+        self,
+        default_interval: float = 5.0,
+        no_change_interval: float = 15.0,
+        two_no_change_interval: float = 60.0,
+    ):
+        self.default_interval = default_interval
+        self.no_change_interval = no_change_interval
+        self.two_no_change_interval = two_no_change_interval
+        self._interval = default_interval
+
+    def update(self, results_differ: bool) -> None:
+        if results_differ:
+            self._interval = self.default_interval
+        elif self._interval == self.default_interval:
+            self._interval = self.no_change_interval
+        else:
+            self._interval = self.two_no_change_interval
+
+    def interval(self) -> float:
+        return self._interval
+
+
 class CommsManager(ModuleBase):
     """Communications manager for Atlas Command connections."""
 
@@ -55,12 +86,18 @@ class CommsManager(ModuleBase):
         self._last_method: Optional[str] = None
         self._last_status_key: Optional[tuple[Optional[str], bool]] = None
         self._status_last_change_ts: Optional[float] = None
-        self._last_wifi_check = 0.0
-        self._wifi_check_interval = 5.0
-        self._last_promotion_check = 0.0
+        self._last_wifi_check = float("-inf")
+        self._wifi_policy = WifiPollingPolicy()
+        self._wifi_check_interval = self._wifi_policy.interval()
+        self._wifi_link_unsubscribe: Optional[Callable[[], None]] = None
+        self._last_promotion_check = float("-inf")
         self._promotion_interval = 15.0
         self._request_queue: deque[dict[str, Any]] = deque()
         self._queue_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._publish_q: Optional[queue.Queue] = None
+        self._publisher: Optional[threading.Thread] = None
+        self._publish_lock = threading.Lock()
         self._processing_request = False
 
     def _load_priority_methods(self) -> list[str]:
@@ -226,9 +263,36 @@ class CommsManager(ModuleBase):
 
         self.method = "wifi"
         self.connected = True
-        self._last_wifi_check = time.time()
+        self._last_wifi_check = time.monotonic()
+        self._watch_wifi_link()
         return True
 
+    def _watch_wifi_link(self) -> None:
+        """Subscribe to link-down events from the WiFi client, if it offers them."""
+        self._unwatch_wifi_link()
+        subscribe = getattr(self.client, "subscribe_link_events", None)
+        if subscribe is None:
+            return
+        self._wifi_link_unsubscribe = subscribe(
+            self.wifi_config.get("interface"), self._handle_wifi_link_down
+        )
+
+    def _unwatch_wifi_link(self) -> None:
+        if self._wifi_link_unsubscribe is None:
+            return
+        try:
+            self._wifi_link_unsubscribe()
+        except Exception as exc:
+            LOGGER.debug("Error while stopping WiFi link events: %s", exc)
+        self._wifi_link_unsubscribe = None
+
+    def _handle_wifi_link_down(self) -> None:
+        """Make the loop re-check WiFi on its next pass and restart the back-off."""
+        self._wifi_policy.update(results_differ=True)
+        self._wifi_check_interval = self._wifi_policy.interval()
+        self._last_wifi_check = float("-inf")
+        self._wake.set()
+
     def _init_meshtastic(self) -> bool:
         try:
             self.client = build_meshtastic_client(
@@ -242,6 +306,7 @@ class CommsManager(ModuleBase):
             LOGGER.error("Failed to initialize meshtastic comms: %s", exc)
             return False
 
+        self._unwatch_wifi_link()
         self.method = "meshtastic"
         self.connected = True
         return True
@@ -258,14 +323,18 @@ class CommsManager(ModuleBase):
         self.bus.subscribe("os.boot_complete", self._handle_boot_complete)
 
         self._publish_status(force=True)
+        self._start_publisher()
         self._thread = threading.Thread(target=self._loop, daemon=True)
         self._thread.start()
 
     def stop(self) -> None:
         self._logger.info("Stopping Comms Manager")
         self.running = False
+        self._wake.set()
         if self._thread:
             self._thread.join(timeout=1.0)
+        self._stop_publisher()
+        self._unwatch_wifi_link()
         # Close radio if present
         if (
             self.method == "meshtastic"
@@ -278,40 +347,29 @@ class CommsManager(ModuleBase):
                 # Best-effort cleanup: log but do not raise during shutdown.
                 LOGGER.warning("Error while closing meshtastic radio: %s", exc, exc_info=True)
 
-    def _loop(self):
-        """Main comms loop - polls for incoming messages and handles reconnection."""
+    def _loop(self, max_iterations: Optional[int] = None):
+        """Main comms loop - polls for incoming messages and handles reconnection.
+
+        ``max_iterations`` bounds the number of passes; ``None`` runs until stopped.
+        """
         consecutive_errors = 0
         max_consecutive_errors = 5
+        remaining = max_iterations
 
-        while self.running:
+        while self.running and remaining != 0:
+            if remaining is not None:
+                remaining -= 1
+            now = time.monotonic()
             if not self.client or not self.connected:
                 self._attempt_reconnection()
                 time.sleep(1)
                 continue
 
-            if self.method == "wifi":
-                now = time.time()
-                if now - self._last_wifi_check >= self._wifi_check_interval:
-                    self._last_wifi_check = now
-                    try:
-                        if not self.client.is_connected(
-                            self.wifi_config.get("interface")
-                        ):
-                            self._handle_disconnection()
-                            continue
-                        if not self.client.has_connectivity():
-                            self.client.mark_bad_current(
-                                self.wifi_config.get("interface")
-                            )
-                            self.client.disconnect(self.wifi_config.get("interface"))
-                            self._handle_disconnection()
-                            continue
-                    except Exception as exc:
-                        LOGGER.warning("WiFi connection check failed: %s", exc)
-                        self._handle_disconnection()
-                        continue
-
-            if self._should_promote():
+            if self.method == "wifi" and not self._poll_wifi_health(now):
+                self._handle_disconnection()
+                continue
+
+            if self._should_promote(now):
                 if self._promote_to_preferred():
                     continue
 
@@ -327,7 +385,7 @@ class CommsManager(ModuleBase):
                 continue
 
             if self.method != "meshtastic":
-                time.sleep(1)
+                self._idle_wait(now)
                 continue
 
             try:
@@ -381,8 +439,38 @@ class CommsManager(ModuleBase):
                 else:
                     time.sleep(0.1)  # Brief pause before retry
 
+    def _poll_wifi_health(self, now: float) -> bool:
+        """Check the WiFi link if the back-off interval is due; False if it failed.
+
+        Link-down events reset the interval (see ``_handle_wifi_link_down``),
+        so a stable link is probed less often without delaying drop detection.
+        """
+        if now - self._last_wifi_check < self._wifi_check_interval:
+            return True
+        self._last_wifi_check = now
+        try:
+            healthy = self._check_wifi_link()
+        except Exception as exc:
+            LOGGER.warning("WiFi connection check failed: %s", exc)
+            healthy = False
+        self._wifi_policy.update(results_differ=not healthy)
+        self._wifi_check_interval = self._wifi_policy.interval()
+        return healthy
+
+    def _check_wifi_link(self) -> bool:
+        """Return True if the WiFi link is up and reaches the network."""
+        interface = self.wifi_config.get("interface")
+        if not self.client.is_connected(interface):
+            return False
+        if not self.client.has_connectivity():
+            self.client.mark_bad_current(interface)
+            self.client.disconnect(interface)
+            return False
+        return True
+
     def _handle_disconnection(self):
         """Handle transport disconnection."""
+        self._unwatch_wifi_link()
         if self.connected:
             self.connected = False
             self.bus.publish("comms.connection_lost", {"timestamp": time.time()})
@@ -437,6 +525,18 @@ class CommsManager(ModuleBase):
             self._reconnect_attempts += 1
             self.connected = False
 
+    def _idle_wait(self, now: float) -> None:
+        """Block until a request is enqueued or the next timed check is due."""
+        if not self.running:
+            return
+        deadline = self._last_wifi_check + self._wifi_check_interval
+        if self._method_sequence and self.method != self._method_sequence[0]:
+            deadline = min(
+                deadline, self._last_promotion_check + self._promotion_interval
+            )
+        self._wake.wait(max(deadline - now, 0.0))
+        self._wake.clear()
+
     def _dequeue_request(self) -> Optional[dict[str, Any]]:
         with self._queue_lock:
             if self._request_queue:
@@ -465,8 +565,7 @@ class CommsManager(ModuleBase):
         try:
             result = func(**args)
             elapsed = time.time() - start
-            self.bus.publish(
-                "comms.response",
+            self._publish_response(
                 {
                     "function": func_name,
                     "request_id": req_id,
@@ -489,8 +588,7 @@ class CommsManager(ModuleBase):
                         try:
                             result = retry_func(**args)
                             elapsed = time.time() - start
-                            self.bus.publish(
-                                "comms.response",
+                            self._publish_response(
                                 {
                                     "function": func_name,
                                     "request_id": req_id,
@@ -508,8 +606,7 @@ class CommsManager(ModuleBase):
                             error = retry_exc
             elapsed = time.time() - start
             LOGGER.exception("Error handling comms function %s: %s", func_name, error)
-            self.bus.publish(
-                "comms.response",
+            self._publish_response(
                 {
                     "function": func_name,
                     "request_id": req_id,
@@ -519,18 +616,77 @@ class CommsManager(ModuleBase):
                 },
             )
 
-    def _should_promote(self) -> bool:
+    def _start_publisher(self) -> None:
+        """Start the writer thread that delivers comms.response events."""
+        with self._publish_lock:
+            if self._publisher and self._publisher.is_alive():
+                return
+            publish_q: queue.Queue = queue.Queue()
+            publisher = threading.Thread(
+                target=self._publish_worker, args=(publish_q,), daemon=True
+            )
+            self._publish_q = publish_q
+            self._publisher = publisher
+            publisher.start()
+
+    def _stop_publisher(self) -> None:
+        # Detach the queue and enqueue the sentinel atomically, so later
+        # responses publish inline instead of landing behind the sentinel.
+        with self._publish_lock:
+            publish_q, publisher = self._publish_q, self._publisher
+            self._publish_q = None
+            self._publisher = None
+            if publish_q is None:
+                return
+            publish_q.put(None)
+        if publisher:
+            publisher.join(timeout=1.0)
+            if publisher.is_alive():
+                # The writer still owns the queue and will finish it.
+                return
+        self._drain_publish_queue(publish_q)
+
+    def _drain_publish_queue(self, publish_q: queue.Queue) -> None:
+        """Publish anything left in a stopped writer's queue inline."""
+        while True:
+            try:
+                payload = publish_q.get_nowait()
+            except queue.Empty:
+                return
+            if payload is not None:
+                self.bus.publish("comms.response", payload)
+
+    def _publish_worker(self, publish_q: queue.Queue) -> None:
+        for payload in iter(publish_q.get, None):
+            try:
+                self.bus.publish("comms.response", payload)
+            finally:
+                publish_q.task_done()
+        publish_q.task_done()
+
+    def _publish_response(self, payload: dict[str, Any]) -> None:
+        """Hand a response to the writer thread, or publish inline if it is not running."""
+        with self._publish_lock:
+            publish_q = self._publish_q
+            if publish_q is not None:
+                publish_q.put(payload)
+                return
+        self.bus.publish("comms.response", payload)
+
+    def _should_promote(self, now: Optional[float] = None) -> bool:
         if not self.connected or not self._method_sequence:
             return False
         if self.method == self._method_sequence[0]:
             return False
         if self._processing_request:
             return False
-        if not self._meshtastic_outbox_empty():
-            return False
-        now = time.time()
+        if now is None:
+            now = time.monotonic()
         if now - self._last_promotion_check < self._promotion_interval:
             return False
+        # Probe the spool only once the interval is due; it is the costly check.
+        if not self._meshtastic_outbox_empty():
+            return False
         self._last_promotion_check = now
         return True
 
@@ -562,6 +718,7 @@ class CommsManager(ModuleBase):
             self.connected = True
             self._method_index = 0
             self._register_functions()
+            self._watch_wifi_link()
             self._publish_method_change()
             LOGGER.info("Promoted comms to wifi")
             return True
@@ -595,6 +752,7 @@ class CommsManager(ModuleBase):
             return
         with self._queue_lock:
             self._request_queue.append(data)
+        self._wake.set()
 
     def _handle_get_status(self, data):
         request_id = None
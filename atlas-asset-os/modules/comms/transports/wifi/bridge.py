@@ -1,19 +1,36 @@
 import asyncio
+import locale
 import logging
 import os
+import re
 import shlex
 import subprocess
 import sys
+import threading
 from pathlib import Path
-from typing import Any, Dict, Optional
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Optional
 
-try:
-    import httpx
-except Exception:  # pragma: no cover - optional dependency for wifi transport
-    httpx = None  # type: ignore
+# Optional dependencies are imported on first use (see _httpx() and
+# _http_client_cls()). Until then these hold _UNLOADED; None means the
+# dependency is unavailable, which tests also use to simulate a missing one.
+_UNLOADED: Any = object()
+httpx: Any = _UNLOADED
+AtlasCommandHttpClient: Any = _UNLOADED
 
 LOGGER = logging.getLogger("modules.comms.wifi")
 
+# SSID queries and scans run without text=True; these patterns match the raw
+# bytes so only the SSIDs we return are ever decoded.
+_WINDOWS_SSID_RE = re.compile(rb"^[ \t]*SSID[ \t]*:[ \t]*(.*?)[ \t\r]*$", re.MULTILINE)
+_LINUX_ACTIVE_SSID_RE = re.compile(rb"^yes:(.*)$", re.MULTILINE)
+_MACOS_SSID_RE = re.compile(rb"Current Wi-Fi Network:(.*)")
+
+# `nmcli device monitor` prints "<device>: <state>" lines; these states mean
+# the link went down.
+_LINK_DOWN_STATES = (b"disconnected", b"unavailable", b"unmanaged")
+_LINK_MONITOR_STOP_TIMEOUT = 0.5
+
 
 def _find_repo_root(start: Path) -> Path:
     """Walk up parents to locate the repo root (directory containing .git)."""
@@ -30,22 +47,40 @@ except ImportError:
     def _is_test_env_impl() -> bool:
             return bool(os.getenv("PYTEST_CURRENT_TEST") or os.getenv("ATLAS_TEST_MODE"))
 
-# Prefer the in-repo atlas_asset_http_client_python for dev use.
-_ROOT = _find_repo_root(Path(__file__).resolve().parent)
-_CLIENT_SRC = (
-    _ROOT
-    / "Atlas_Client_SDKs"
-    / "connection_packages"
-    / "atlas_asset_http_client_python"
-    / "src"
-)
-if str(_CLIENT_SRC) not in sys.path:
-    sys.path.insert(0, str(_CLIENT_SRC))
 
-try:
-    from atlas_asset_http_client_python import AtlasCommandHttpClient  # type: ignore  # noqa: E402
-except Exception:  # pragma: no cover - optional dependency for wifi transport
-    AtlasCommandHttpClient = None  # type: ignore
+def _httpx() -> Any:
+    """Return the httpx module, importing it on first use (None if unavailable)."""
+    global httpx
+    if httpx is _UNLOADED:
+        try:
+            import httpx as _httpx_module
+        except Exception:  # pragma: no cover - optional dependency for wifi transport
+            _httpx_module = None  # type: ignore
+        httpx = _httpx_module
+    return httpx
+
+
+def _http_client_cls() -> Any:
+    """Return AtlasCommandHttpClient, importing it on first use (None if unavailable)."""
+    global AtlasCommandHttpClient
+    if AtlasCommandHttpClient is _UNLOADED:
+        # Prefer the in-repo atlas_asset_http_client_python for dev use.
+        root = _find_repo_root(Path(__file__).resolve().parent)
+        client_src = (
+            root
+            / "Atlas_Client_SDKs"
+            / "connection_packages"
+            / "atlas_asset_http_client_python"
+            / "src"
+        )
+        if str(client_src) not in sys.path:
+            sys.path.insert(0, str(client_src))
+        try:
+            from atlas_asset_http_client_python import AtlasCommandHttpClient as _client_cls  # type: ignore
+        except Exception:  # pragma: no cover - optional dependency for wifi transport
+            _client_cls = None  # type: ignore
+        AtlasCommandHttpClient = _client_cls
+    return AtlasCommandHttpClient
 
 
 def _run_async(coro):
@@ -160,22 +195,28 @@ def _connect_with_networksetup(
     return False
 
 
+# netsh writes in the Windows ANSI code page; nmcli and networksetup write UTF-8.
+_OUTPUT_ENCODING = (
+    locale.getpreferredencoding(False) if sys.platform == "win32" else "utf-8"
+)
+
+
+def _decode(raw: bytes) -> str:
+    return raw.decode(_OUTPUT_ENCODING, "replace")
+
+
 def _current_ssid_windows() -> Optional[str]:
     result = subprocess.run(
         ["netsh", "wlan", "show", "interfaces"],
         capture_output=True,
-        text=True,
         check=False,
     )
     if result.returncode != 0:
         return None
-    for line in result.stdout.splitlines():
-        if "SSID" in line and "BSSID" not in line:
-            parts = line.split(":", 1)
-            if len(parts) == 2:
-                ssid = parts[1].strip()
-                if ssid and ssid.lower() != "no":
-                    return ssid
+    for match in _WINDOWS_SSID_RE.finditer(result.stdout):
+        ssid = match.group(1)
+        if ssid and ssid.lower() != b"no":
+            return _decode(ssid)
     return None
 
 
@@ -183,14 +224,13 @@ def _current_ssid_linux() -> Optional[str]:
     result = subprocess.run(
         ["nmcli", "-t", "-f", "ACTIVE,SSID", "dev", "wifi"],
         capture_output=True,
-        text=True,
         check=False,
     )
     if result.returncode != 0:
         return None
-    for line in result.stdout.splitlines():
-        if line.startswith("yes:"):
-            return line.split(":", 1)[1].strip() or None
+    match = _LINUX_ACTIVE_SSID_RE.search(result.stdout)
+    if match:
+        return _decode(match.group(1).strip()) or None
     return None
 
 
@@ -200,26 +240,29 @@ def _current_ssid_macos(interface: Optional[str]) -> Optional[str]:
     result = subprocess.run(
         ["networksetup", "-getairportnetwork", interface],
         capture_output=True,
-        text=True,
         check=False,
     )
     if result.returncode != 0:
         return None
-    output = result.stdout.strip()
-    if "Current Wi-Fi Network:" in output:
-        return output.split("Current Wi-Fi Network:", 1)[1].strip() or None
+    match = _MACOS_SSID_RE.search(result.stdout)
+    if match:
+        return _decode(match.group(1).strip()) or None
     return None
 
 
-def get_current_ssid(interface: Optional[str]) -> Optional[str]:
-    platform = sys.platform
-    if platform.startswith("win"):
-        return _current_ssid_windows()
-    if platform.startswith("linux"):
-        return _current_ssid_linux()
-    if platform == "darwin":
-        return _current_ssid_macos(interface)
-    return None
+# Platform dispatch tables are built once and the public helpers are bound
+# to the entry for this platform at import time. Every entry looks its helper
+# up by name when called, so patching a helper still takes effect.
+_SSID_DISPATCH = MappingProxyType(
+    {
+        "win32": lambda interface: _current_ssid_windows(),
+        "linux": lambda interface: _current_ssid_linux(),
+        "darwin": lambda interface: _current_ssid_macos(interface),
+    }
+)
+get_current_ssid: Callable[[Optional[str]], Optional[str]] = _SSID_DISPATCH.get(
+    sys.platform, lambda interface: None
+)
 
 
 BAD_SSIDS: set[str] = set()
@@ -255,14 +298,87 @@ def _disconnect_macos(interface: Optional[str]) -> None:
     )
 
 
-def disconnect_current(interface: Optional[str]) -> None:
-    platform = sys.platform
-    if platform.startswith("win"):
-        _disconnect_windows()
-    elif platform.startswith("linux"):
-        _disconnect_linux(interface)
-    elif platform == "darwin":
-        _disconnect_macos(interface)
+_DISCONNECT_DISPATCH = MappingProxyType(
+    {
+        "win32": lambda interface: _disconnect_windows(),
+        "linux": lambda interface: _disconnect_linux(interface),
+        "darwin": lambda interface: _disconnect_macos(interface),
+    }
+)
+disconnect_current: Callable[[Optional[str]], None] = _DISCONNECT_DISPATCH.get(
+    sys.platform, lambda interface: None
+)
+
+
+def _wifi_device_linux() -> Optional[str]:
+    """Return the first WiFi device NetworkManager knows about, if any."""
+    try:
+        result = subprocess.run(
+            ["nmcli", "-t", "-f", "DEVICE,TYPE", "device"],
+            capture_output=True,
+            check=False,
+        )
+    except OSError:
+        return None
+    if result.returncode != 0:
+        return None
+    for line in result.stdout.splitlines():
+        device, _, dev_type = line.partition(b":")
+        if dev_type.strip() == b"wifi" and device:
+            return _decode(device)
+    return None
+
+
+def _watch_link_linux(
+    interface: Optional[str], on_down: Callable[[], None]
+) -> Optional[Callable[[], None]]:
+    # Without a device, `nmcli device monitor` reports ethernet and loopback
+    # changes too, so pin it to the WiFi device.
+    interface = interface or _wifi_device_linux()
+    if not interface:
+        LOGGER.debug("WiFi link events unavailable: no WiFi device found")
+        return None
+    try:
+        proc = subprocess.Popen(
+            ["nmcli", "device", "monitor", interface],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+        )
+    except OSError as exc:
+        LOGGER.debug("WiFi link events unavailable: %s", exc)
+        return None
+
+    def _read_events() -> None:
+        try:
+            for line in proc.stdout:
+                _, _, state = line.partition(b":")
+                if state.strip().startswith(_LINK_DOWN_STATES):
+                    on_down()
+        except (OSError, ValueError):
+            pass  # Pipe closed underneath us during unsubscribe.
+
+    reader = threading.Thread(target=_read_events, daemon=True)
+    reader.start()
+
+    def _close() -> None:
+        proc.terminate()
+        try:
+            proc.wait(timeout=_LINK_MONITOR_STOP_TIMEOUT)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()
+        reader.join(timeout=_LINK_MONITOR_STOP_TIMEOUT)
+        proc.stdout.close()
+
+    return _close
+
+
+_LINK_EVENTS_DISPATCH = MappingProxyType(
+    {"linux": lambda interface, on_down: _watch_link_linux(interface, on_down)}
+)
+watch_link_events: Callable[
+    [Optional[str], Callable[[], None]], Optional[Callable[[], None]]
+] = _LINK_EVENTS_DISPATCH.get(sys.platform, lambda interface, on_down: None)
 
 
 def mark_bad_ssid(ssid: Optional[str]) -> None:
@@ -278,7 +394,6 @@ def _scan_open_networks_windows() -> list[str]:
     result = subprocess.run(
         ["netsh", "wlan", "show", "networks", "mode=bssid"],
         capture_output=True,
-        text=True,
         check=False,
     )
     if result.returncode != 0:
@@ -288,17 +403,17 @@ def _scan_open_networks_windows() -> list[str]:
     is_open = False
     for line in result.stdout.splitlines():
         line = line.strip()
-        if line.startswith("SSID "):
+        if line.startswith(b"SSID "):
             if current_ssid and is_open:
-                ssids.append(current_ssid)
-            current_ssid = line.split(":", 1)[1].strip()
+                ssids.append(_decode(current_ssid))
+            current_ssid = line.split(b":", 1)[1].strip()
             is_open = False
-        elif line.lower().startswith("authentication"):
-            auth = line.split(":", 1)[1].strip().lower()
-            if "open" in auth:
+        elif line.lower().startswith(b"authentication"):
+            auth = line.split(b":", 1)[1].strip().lower()
+            if b"open" in auth:
                 is_open = True
     if current_ssid and is_open:
-        ssids.append(current_ssid)
+        ssids.append(_decode(current_ssid))
     return ssids
 
 
@@ -306,19 +421,18 @@ def _scan_open_networks_linux() -> list[str]:
     result = subprocess.run(
         ["nmcli", "-t", "-f", "SSID,SECURITY", "dev", "wifi"],
         capture_output=True,
-        text=True,
         check=False,
     )
     if result.returncode != 0:
         return []
     ssids: list[str] = []
     for line in result.stdout.splitlines():
-        ssid, _, security = line.partition(":")
+        ssid, _, security = line.partition(b":")
         if not ssid:
             continue
         sec = security.strip()
-        if sec in ("", "--"):
-            ssids.append(ssid)
+        if sec in (b"", b"--"):
+            ssids.append(_decode(ssid))
     return ssids
 
 
@@ -328,9 +442,7 @@ def _scan_open_networks_macos() -> list[str]:
     )
     if not airport.exists():
         return []
-    result = subprocess.run(
-        [str(airport), "-s"], capture_output=True, text=True, check=False
-    )
+    result = subprocess.run([str(airport), "-s"], capture_output=True, check=False)
     if result.returncode != 0:
         return []
     ssids: list[str] = []
@@ -340,28 +452,48 @@ def _scan_open_networks_macos() -> list[str]:
         if not parts:
             continue
         ssid = parts[0]
-        security = " ".join(parts[5:]) if len(parts) > 5 else ""
-        if not security or security.lower() == "none":
-            ssids.append(ssid)
+        security = b" ".join(parts[5:]) if len(parts) > 5 else b""
+        if not security or security.lower() == b"none":
+            ssids.append(_decode(ssid))
     return ssids
 
 
-def scan_open_networks() -> list[str]:
-    platform = sys.platform
-    if platform.startswith("win"):
-        return _scan_open_networks_windows()
-    if platform.startswith("linux"):
-        return _scan_open_networks_linux()
-    if platform == "darwin":
-        return _scan_open_networks_macos()
-    return []
+_SCAN_DISPATCH = MappingProxyType(
+    {
+        "win32": lambda: _scan_open_networks_windows(),
+        "linux": lambda: _scan_open_networks_linux(),
+        "darwin": lambda: _scan_open_networks_macos(),
+    }
+)
+scan_open_networks: Callable[[], list[str]] = _SCAN_DISPATCH.get(
+    sys.platform, lambda: []
+)
+
+
+_CONNECT_DISPATCH = MappingProxyType(
+    {
+        "win32": lambda ssid, password, interface: _connect_with_windows(
+            ssid, interface
+        ),
+        "linux": lambda ssid, password, interface: _connect_with_nmcli(
+            ssid, password
+        ),
+        "darwin": lambda ssid, password, interface: _connect_with_networksetup(
+            ssid, password, interface
+        ),
+    }
+)
+connect_to_network: Callable[[str, Optional[str], Optional[str]], bool] = (
+    _CONNECT_DISPATCH.get(sys.platform, lambda ssid, password, interface: False)
+)
 
 
 def _verify_connectivity(base_url: str, timeout: float) -> bool:
-    if httpx is None:
+    http = _httpx()
+    if http is None:
         return False
     try:
-        response = httpx.get(f"{base_url.rstrip('/')}/health", timeout=timeout)
+        response = http.get(f"{base_url.rstrip('/')}/health", timeout=timeout)
         response.raise_for_status()
         return True
     except Exception:
@@ -376,17 +508,7 @@ def _connect_and_verify(
     timeout: float,
     interface: Optional[str],
 ) -> bool:
-    connected = False
-    if sys.platform.startswith("win"):
-        connected = _connect_with_windows(ssid, interface)
-    elif sys.platform.startswith("linux"):
-        connected = _connect_with_nmcli(ssid, password)
-    elif sys.platform == "darwin":
-        connected = _connect_with_networksetup(ssid, password, interface)
-    else:
-        return False
-
-    if not connected:
+    if not connect_to_network(ssid, password, interface):
         return False
     if _verify_connectivity(base_url, timeout):
         return True
@@ -403,7 +525,7 @@ class WifiApiClient:
         self._timeout = timeout
 
     async def _with_client(self, method: str, *args: Any, **kwargs: Any) -> Any:
-        async with AtlasCommandHttpClient(
+        async with _http_client_cls()(
             self._base_url, token=self._token, timeout=self._timeout
         ) as client:
             func = getattr(client, method)
@@ -420,9 +542,10 @@ class WifiApiClient:
     ):
         _ = max_retries
         request_timeout = timeout or self._timeout
-        if httpx is None:
+        http = _httpx()
+        if http is None:
             raise RuntimeError("httpx is required for wifi health checks")
-        response = httpx.get(f"{self._base_url}/health", timeout=request_timeout)
+        response = http.get(f"{self._base_url}/health", timeout=request_timeout)
         response.raise_for_status()
         return response.json() if response.content else {"status": "ok"}
 
@@ -460,6 +583,12 @@ class WifiApiClient:
     def disconnect(self, interface: Optional[str]) -> None:
         disconnect_current(interface)
 
+    def subscribe_link_events(
+        self, interface: Optional[str], callback: Callable[[], None]
+    ) -> Optional[Callable[[], None]]:
+        """Call ``callback`` when the link drops; returns an unsubscribe hook or None."""
+        return watch_link_events(interface, callback)
+
     def __getattr__(self, name: str):
         direct_methods = {
             "list_entities",
@@ -526,7 +655,7 @@ def build_wifi_client(
     api_token: Optional[str],
     wifi_config: Dict[str, Any],
 ) -> WifiApiClient:
-    if AtlasCommandHttpClient is None:
+    if _http_client_cls() is None:
         raise RuntimeError("atlas_asset_http_client_python is required for wifi comms")
     if not base_url:
         raise RuntimeError("atlas.base_url is required for wifi comms")
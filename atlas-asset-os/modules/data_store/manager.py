@@ -1,15 +1,61 @@
 import json
 import logging
+import math
 import threading
 import time
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import IO, Any, Dict, List, Optional
 
 from modules.module_base import ModuleBase
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 LOGGER = logging.getLogger("modules.data_store")
 
 
+def _has_non_finite(value: Any) -> bool:
+    """True if ``value`` holds a NaN/Infinity float anywhere inside it."""
+    stack = [value]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, float):
+            if not math.isfinite(item):
+                return True
+        elif isinstance(item, dict):
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple)):
+            stack.extend(item)
+    return False
+
+
+def _dumps(store: Dict[str, Any], *, non_finite: bool = False) -> str:
+    """Serialize the store, preferring orjson when it is installed.
+
+    orjson writes NaN/Infinity as ``null``, so callers pass ``non_finite`` when
+    the store holds any; ints beyond 64 bits make orjson raise. Both cases go
+    through json, which keeps them intact.
+    """
+    if orjson is not None and not non_finite:
+        try:
+            return orjson.dumps(store, option=orjson.OPT_INDENT_2).decode("utf-8")
+        except TypeError:
+            pass
+    return json.dumps(store, indent=2)
+
+
+def _loads(text: str) -> Any:
+    """Parse a persisted store.
+
+    Always json: orjson rejects the NaN tokens json writes and reads ints
+    beyond 64 bits back as floats, and the file does not record which
+    serializer produced it. Loading happens once at startup.
+    """
+    return json.loads(text)
+
+
 class DataStoreManager(ModuleBase):
     """General-purpose in-memory data store with optional persistence."""
 
@@ -20,6 +66,9 @@ class DataStoreManager(ModuleBase):
     def __init__(self, bus, config):
         super().__init__(bus, config)
         self._store: Dict[str, Dict[str, Any]] = {}
+        # (namespace, key) of records holding NaN/Infinity, kept up to date on
+        # writes so persisting never has to scan the whole store.
+        self._non_finite: set[tuple[str, str]] = set()
         self._lock = threading.Lock()
         self._persist_enabled = False
         self._persist_path: Optional[Path] = None
@@ -65,6 +114,10 @@ class DataStoreManager(ModuleBase):
         with self._lock:
             bucket = self._store.setdefault(namespace, {})
             bucket[str(key)] = record
+            if _has_non_finite(record):
+                self._non_finite.add((namespace, str(key)))
+            else:
+                self._non_finite.discard((namespace, str(key)))
         self.bus.publish(
             "data_store.updated",
             {"namespace": namespace, "key": str(key), "record": record},
@@ -103,6 +156,7 @@ class DataStoreManager(ModuleBase):
             bucket = self._store.get(namespace)
             if bucket and str(key) in bucket:
                 removed = bucket.pop(str(key))
+                self._non_finite.discard((namespace, str(key)))
         self.bus.publish(
             "data_store.deleted",
             {"namespace": namespace, "key": str(key), "record": removed},
@@ -139,17 +193,32 @@ class DataStoreManager(ModuleBase):
             {"snapshot": snapshot, "request_id": data.get("request_id")},
         )
 
+    def _open_persist(self, mode: str) -> IO[str]:
+        """Open the persistence file; writing creates its parent directory."""
+        if "w" in mode:
+            self._persist_path.parent.mkdir(parents=True, exist_ok=True)
+        return open(self._persist_path, mode, encoding="utf-8")
+
     def _load_persisted(self) -> None:
         if not self._persist_enabled or not self._persist_path:
             return
-        if not self._persist_path.exists():
-            return
         try:
-            payload = json.loads(self._persist_path.read_text())
+            with self._open_persist("r") as handle:
+                payload = _loads(handle.read())
             if isinstance(payload, dict):
+                non_finite = {
+                    (namespace, key)
+                    for namespace, bucket in payload.items()
+                    if isinstance(bucket, dict)
+                    for key, record in bucket.items()
+                    if _has_non_finite(record)
+                }
                 with self._lock:
                     self._store = payload
+                    self._non_finite = non_finite
                 self._logger.info("Loaded data store from %s", self._persist_path)
+        except FileNotFoundError:
+            return
         except Exception as exc:
             self._logger.warning("Failed to load data store: %s", exc)
 
@@ -164,10 +233,10 @@ class DataStoreManager(ModuleBase):
             return
         self._last_persist = now
         try:
-            self._persist_path.parent.mkdir(parents=True, exist_ok=True)
             with self._lock:
-                data = json.dumps(self._store, indent=2)
-            self._persist_path.write_text(data)
+                data = _dumps(self._store, non_finite=bool(self._non_finite))
+            with self._open_persist("w") as handle:
+                handle.write(data)
         except Exception as exc:
             self._logger.warning("Failed to persist data store: %s", exc)
 
@@ -55,12 +55,12 @@ class ModuleBase(ABC):
 
     def get_module_config(self) -> Dict[str, Any]:
         """Get this module's configuration section."""
-        return self.config.get("modules", {}).get(self.MODULE_NAME, {})
+        modules = self.config.get("modules")
+        return (modules or {}).get(self.MODULE_NAME, {})
 
     def is_enabled(self) -> bool:
         """Check if this module is enabled in config."""
-        module_cfg = self.get_module_config()
-        return module_cfg.get("enabled", True)
+        return self.get_module_config().get("enabled", True)
 
     def system_check(self) -> Dict[str, Any]:
         """
@@ -23,6 +23,7 @@ class OperationsManager(ModuleBase):
     def __init__(self, bus, config):
         super().__init__(bus, config)
         self._thread: Optional[threading.Thread] = None
+        self._wake = threading.Event()
         ops_cfg = self.get_module_config()
         self._heartbeat_interval_s = float(ops_cfg.get("heartbeat_interval_s", 30.0))
         self._checkin_interval_default_s = float(
@@ -54,6 +55,7 @@ class OperationsManager(ModuleBase):
         self._current_checkin_interval_s = self._checkin_interval_default_s
         self._registration_started = False
         self._registration_complete = False
+        self._registration_thread: Optional[threading.Thread] = None
         self._checkin_payload_logged = False
         self._checkin_waiting_logged = False
         self._data_store_sync_interval_s = 1.0
@@ -87,12 +89,14 @@ class OperationsManager(ModuleBase):
         self.bus.subscribe("commands.unregister", self._handle_command_unregister)
         self.bus.subscribe("system.check.request", self._handle_system_check_request)
 
+        self._wake.clear()
         self._thread = threading.Thread(target=self._loop, daemon=True)
         self._thread.start()
 
     def stop(self) -> None:
         self._logger.info("Stopping Operations Manager")
         self.running = False
+        self._wake.set()
         if self._thread:
             self._thread.join(timeout=1.0)
 
@@ -171,7 +175,9 @@ class OperationsManager(ModuleBase):
                     )
 
             self._maybe_dispatch_command()
-            time.sleep(1)
+            # Tick once a second; new tasks and stop() cut the wait short.
+            self._wake.wait(1.0)
+            self._wake.clear()
 
     def _handle_comms_message(self, data):
         """Handle messages received from the outside world."""
@@ -364,6 +370,7 @@ class OperationsManager(ModuleBase):
                     "skip_acknowledgment": status == "acknowledged",
                 }
             )
+        self._wake.set()
 
     def _maybe_dispatch_command(self) -> None:
         with self._command_lock:
@@ -431,6 +438,7 @@ class OperationsManager(ModuleBase):
             )
         with self._command_lock:
             self._active_command = None
+        self._wake.set()
 
     def _handle_method_changed(self, data):
         if not isinstance(data, dict):
@@ -470,7 +478,10 @@ class OperationsManager(ModuleBase):
             def _register():
                 self._registration_complete = register_asset(self.bus, self.config)
 
-            threading.Thread(target=_register, daemon=True).start()
+            self._registration_thread = threading.Thread(
+                target=_register, daemon=True
+            )
+            self._registration_thread.start()
 
     def _handle_data_store_snapshot(self, data):
         if not isinstance(data, dict):
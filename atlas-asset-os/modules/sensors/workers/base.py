@@ -14,23 +14,28 @@ class SensorWorker:
         self.sensor_type = str(device_cfg.get("type", "unknown"))
         self._thread: threading.Thread | None = None
         self._running = False
+        self._stop_event = threading.Event()
 
     def start(self) -> None:
         if self._thread and self._thread.is_alive():
             return
         self._running = True
+        self._stop_event.clear()
         self._thread = threading.Thread(target=self.run, daemon=True)
         self._thread.start()
 
     def stop(self) -> None:
         self._running = False
+        self._stop_event.set()
         if self._thread:
             self._thread.join(timeout=1.0)
 
     def run(self) -> None:
-        """Override in subclasses. Should loop while self._running."""
-        while self._running:
-            time.sleep(1)
+        """Override in subclasses. Should loop while self._running.
+
+        Wait on ``self._stop_event`` between iterations so stop() is prompt.
+        """
+        self._stop_event.wait()
 
     def publish_output(self, data: Dict[str, Any]) -> None:
         payload = {
@@ -1,4 +1,3 @@
-import time
 from typing import Any, Dict
 
 from modules.sensors.workers.base import SensorWorker
@@ -23,4 +22,4 @@ class CameraBearingWorker(SensorWorker):
                     "confidence": self._confidence,
                 }
             )
-            time.sleep(self._interval_s)
+            self._stop_event.wait(self._interval_s)
@@ -1,101 +1,121 @@
 """Tests for the WiFi transport bridge."""
 
+import subprocess
 from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 
+from modules.comms.transports.wifi import bridge
+from modules.comms.transports.wifi.bridge import (
+    BAD_SSIDS,
+    WifiApiClient,
+    _connect_with_networksetup,
+    _connect_with_nmcli,
+    _connect_with_windows,
+    _current_ssid_linux,
+    _current_ssid_macos,
+    _current_ssid_windows,
+    _disconnect_linux,
+    _disconnect_macos,
+    _disconnect_windows,
+    _scan_open_networks_linux,
+    build_wifi_client,
+    is_bad_ssid,
+    mark_bad_ssid,
+)
 from tests.conftest import MOCK_API_TOKEN
 
 
-class TestWifiBridgeHelpers:
-    """Tests for WiFi bridge helper functions."""
-
-    def test_get_current_ssid_windows(self):
-        """Test get_current_ssid on Windows."""
-        from modules.comms.transports.wifi.bridge import _current_ssid_windows
-
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = Mock(
-                returncode=0,
-                stdout="    SSID                   : TestNetwork\n    BSSID                  : 00:11:22:33:44:55\n"
-            )
-
-            result = _current_ssid_windows()
-
-            assert result == "TestNetwork"
+def _cp(returncode=0, stdout="", stderr=""):
+    """Build a subprocess.run result restricted to CompletedProcess attributes."""
+    return Mock(
+        spec=subprocess.CompletedProcess,
+        returncode=returncode,
+        stdout=stdout,
+        stderr=stderr,
+    )
 
-    def test_get_current_ssid_windows_not_connected(self):
-        """Test get_current_ssid on Windows when not connected."""
-        from modules.comms.transports.wifi.bridge import _current_ssid_windows
-
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = Mock(returncode=1, stdout="")
-
-            result = _current_ssid_windows()
-
-            assert result is None
-
-    def test_get_current_ssid_linux(self):
-        """Test get_current_ssid on Linux."""
-        from modules.comms.transports.wifi.bridge import _current_ssid_linux
-
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = Mock(
-                returncode=0,
-                stdout="yes:TestNetwork\nno:OtherNetwork\n"
-            )
 
-            result = _current_ssid_linux()
-
-            assert result == "TestNetwork"
-
-    def test_get_current_ssid_linux_not_connected(self):
-        """Test get_current_ssid on Linux when not connected."""
-        from modules.comms.transports.wifi.bridge import _current_ssid_linux
-
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = Mock(
-                returncode=0,
-                stdout="no:Network1\nno:Network2\n"
-            )
-
-            result = _current_ssid_linux()
-
-            assert result is None
-
-    def test_get_current_ssid_macos(self):
-        """Test get_current_ssid on macOS."""
-        from modules.comms.transports.wifi.bridge import _current_ssid_macos
-
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = Mock(
-                returncode=0,
-                stdout="Current Wi-Fi Network: TestNetwork"
-            )
-
-            result = _current_ssid_macos("en0")
+class TestWifiBridgeHelpers:
+    """Tests for WiFi bridge helper functions."""
 
-            assert result == "TestNetwork"
-            mock_run.assert_called_once()
+    @pytest.mark.parametrize(
+        "current_ssid,args,returncode,stdout,expected",
+        [
+            (
+                _current_ssid_windows,
+                (),
+                0,
+                b"    SSID                   : TestNetwork\n    BSSID                  : 00:11:22:33:44:55\n",
+                "TestNetwork",
+            ),
+            (_current_ssid_windows, (), 1, b"", None),
+            (_current_ssid_linux, (), 0, b"yes:TestNetwork\nno:OtherNetwork\n", "TestNetwork"),
+            (_current_ssid_linux, (), 0, b"no:Network1\nno:Network2\n", None),
+            (_current_ssid_macos, ("en0",), 0, b"Current Wi-Fi Network: TestNetwork", "TestNetwork"),
+            (_current_ssid_macos, ("en0",), 1, b"", None),
+        ],
+        ids=[
+            "windows",
+            "windows-not-connected",
+            "linux",
+            "linux-not-connected",
+            "macos",
+            "macos-not-connected",
+        ],
+    )
+    def test_get_current_ssid(self, current_ssid, args, returncode, stdout, expected):
+        """Test the per-platform get_current_ssid helpers."""
+        with patch("subprocess.run", return_value=_cp(returncode=returncode, stdout=stdout)) as mock_run:
+            result = current_ssid(*args)
+
+        assert result == expected
+        mock_run.assert_called_once()
+
+    def test_windows_ssid_decoded_with_locale_code_page(self, monkeypatch):
+        """Test non-ASCII netsh output is decoded with the Windows code page."""
+        monkeypatch.setattr(bridge, "_OUTPUT_ENCODING", "cp1252")
+        stdout = "    SSID                   : Caf\u00e9\n".encode("cp1252")
+        with patch("subprocess.run", return_value=_cp(stdout=stdout)):
+            assert _current_ssid_windows() == "Caf\u00e9"
 
     def test_get_current_ssid_macos_no_interface(self):
         """Test get_current_ssid on macOS with no interface."""
-        from modules.comms.transports.wifi.bridge import _current_ssid_macos
-
         result = _current_ssid_macos(None)
 
         assert result is None
 
-    def test_get_current_ssid_macos_not_connected(self):
-        """Test get_current_ssid on macOS when not connected."""
-        from modules.comms.transports.wifi.bridge import _current_ssid_macos
-
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = Mock(returncode=1, stdout="")
 
-            result = _current_ssid_macos("en0")
-
-            assert result is None
+class TestPlatformDispatch:
+    """Tests for the per-platform dispatch tables."""
+
+    @pytest.mark.parametrize(
+        "table,platform,helper,args",
+        [
+            ("_SSID_DISPATCH", "win32", "_current_ssid_windows", ("wlan0",)),
+            ("_SSID_DISPATCH", "linux", "_current_ssid_linux", ("wlan0",)),
+            ("_SSID_DISPATCH", "darwin", "_current_ssid_macos", ("en0",)),
+            ("_DISCONNECT_DISPATCH", "win32", "_disconnect_windows", ("wlan0",)),
+            ("_DISCONNECT_DISPATCH", "linux", "_disconnect_linux", ("wlan0",)),
+            ("_DISCONNECT_DISPATCH", "darwin", "_disconnect_macos", ("en0",)),
+            ("_SCAN_DISPATCH", "win32", "_scan_open_networks_windows", ()),
+            ("_SCAN_DISPATCH", "linux", "_scan_open_networks_linux", ()),
+            ("_SCAN_DISPATCH", "darwin", "_scan_open_networks_macos", ()),
+            ("_CONNECT_DISPATCH", "win32", "_connect_with_windows", ("Net", "pw", "wlan0")),
+            ("_CONNECT_DISPATCH", "linux", "_connect_with_nmcli", ("Net", "pw", "wlan0")),
+            ("_CONNECT_DISPATCH", "darwin", "_connect_with_networksetup", ("Net", "pw", "en0")),
+            ("_LINK_EVENTS_DISPATCH", "linux", "_watch_link_linux", ("wlan0", None)),
+        ],
+    )
+    def test_dispatch_entries_call_patched_helpers(
+        self, monkeypatch, table, platform, helper, args
+    ):
+        """Test every dispatch entry looks its helper up when called."""
+        fake = Mock(return_value="patched")
+        monkeypatch.setattr(bridge, helper, fake)
+
+        assert getattr(bridge, table)[platform](*args) == "patched"
+        fake.assert_called_once()
 
 
 class TestWifiBridgeBadSSID:
@@ -103,8 +123,6 @@ class TestWifiBridgeBadSSID:
 
     def test_mark_bad_ssid(self):
         """Test marking an SSID as bad."""
-        from modules.comms.transports.wifi.bridge import mark_bad_ssid, is_bad_ssid, BAD_SSIDS
-
         # Clear any existing bad SSIDs
         BAD_SSIDS.clear()
 
@@ -115,8 +133,6 @@ class TestWifiBridgeBadSSID:
 
     def test_mark_bad_ssid_none(self):
         """Test marking None as bad SSID does nothing."""
-        from modules.comms.transports.wifi.bridge import mark_bad_ssid, BAD_SSIDS
-
         initial_count = len(BAD_SSIDS)
 
         mark_bad_ssid(None)
@@ -129,10 +145,8 @@ class TestWifiConnect:
 
     def test_connect_with_windows_success(self):
         """Test successful WiFi connection on Windows."""
-        from modules.comms.transports.wifi.bridge import _connect_with_windows
-
         with patch("subprocess.run") as mock_run:
-            mock_run.return_value = Mock(returncode=0)
+            mock_run.return_value = _cp(returncode=0)
 
             result = _connect_with_windows("TestNetwork", "wlan0")
 
@@ -141,10 +155,8 @@ class TestWifiConnect:
 
     def test_connect_with_windows_failure(self):
         """Test failed WiFi connection on Windows."""
-        from modules.comms.transports.wifi.bridge import _connect_with_windows
-
         with patch("subprocess.run") as mock_run:
-            mock_run.return_value = Mock(returncode=1, stderr="Connection failed", stdout="")
+            mock_run.return_value = _cp(returncode=1, stderr="Connection failed", stdout="")
 
             result = _connect_with_windows("TestNetwork", None)
 
@@ -152,10 +164,8 @@ class TestWifiConnect:
 
     def test_connect_with_nmcli_success_no_password(self):
         """Test successful WiFi connection via nmcli without password."""
-        from modules.comms.transports.wifi.bridge import _connect_with_nmcli
-
         with patch("subprocess.run") as mock_run:
-            mock_run.return_value = Mock(returncode=0)
+            mock_run.return_value = _cp(returncode=0)
 
             result = _connect_with_nmcli("OpenNetwork", None)
 
@@ -163,10 +173,8 @@ class TestWifiConnect:
 
     def test_connect_with_nmcli_success_with_password(self):
         """Test successful WiFi connection via nmcli with password."""
-        from modules.comms.transports.wifi.bridge import _connect_with_nmcli
-
         with patch("subprocess.run") as mock_run:
-            mock_run.return_value = Mock(returncode=0)
+            mock_run.return_value = _cp(returncode=0)
 
             result = _connect_with_nmcli("SecureNetwork", "password123")
 
@@ -174,10 +182,8 @@ class TestWifiConnect:
 
     def test_connect_with_nmcli_failure(self):
         """Test failed WiFi connection via nmcli."""
-        from modules.comms.transports.wifi.bridge import _connect_with_nmcli
-
         with patch("subprocess.run") as mock_run:
-            mock_run.return_value = Mock(returncode=1, stderr="Network not found", stdout="")
+            mock_run.return_value = _cp(returncode=1, stderr="Network not found", stdout="")
 
             result = _connect_with_nmcli("NonExistentNetwork", None)
 
@@ -185,18 +191,14 @@ class TestWifiConnect:
 
     def test_connect_with_networksetup_no_interface(self):
         """Test networksetup connection with no interface."""
-        from modules.comms.transports.wifi.bridge import _connect_with_networksetup
-
         result = _connect_with_networksetup("TestNetwork", None, None)
 
         assert result is False
 
     def test_connect_with_networksetup_success(self):
         """Test successful networksetup connection."""
-        from modules.comms.transports.wifi.bridge import _connect_with_networksetup
-
         with patch("subprocess.run") as mock_run:
-            mock_run.return_value = Mock(returncode=0)
+            mock_run.return_value = _cp(returncode=0)
 
             result = _connect_with_networksetup("TestNetwork", "password", "en0")
 
@@ -208,8 +210,6 @@ class TestWifiDisconnect:
 
     def test_disconnect_windows(self):
         """Test WiFi disconnection on Windows."""
-        from modules.comms.transports.wifi.bridge import _disconnect_windows
-
         with patch("subprocess.run") as mock_run:
             _disconnect_windows()
 
@@ -220,8 +220,6 @@ class TestWifiDisconnect:
 
     def test_disconnect_linux(self):
         """Test WiFi disconnection on Linux."""
-        from modules.comms.transports.wifi.bridge import _disconnect_linux
-
         with patch("subprocess.run") as mock_run:
             _disconnect_linux("wlan0")
 
@@ -232,8 +230,6 @@ class TestWifiDisconnect:
 
     def test_disconnect_macos_no_interface(self):
         """Test WiFi disconnection on macOS with no interface."""
-        from modules.comms.transports.wifi.bridge import _disconnect_macos
-
         with patch("subprocess.run") as mock_run:
             _disconnect_macos(None)
 
@@ -245,12 +241,10 @@ class TestScanOpenNetworks:
 
     def test_scan_open_networks_linux(self):
         """Test scanning for open networks on Linux."""
-        from modules.comms.transports.wifi.bridge import _scan_open_networks_linux
-
         with patch("subprocess.run") as mock_run:
-            mock_run.return_value = Mock(
+            mock_run.return_value = _cp(
                 returncode=0,
-                stdout="OpenNetwork:\nSecureNetwork:WPA2\nAnotherOpen:--\n"
+                stdout=b"OpenNetwork:\nSecureNetwork:WPA2\nAnotherOpen:--\n"
             )
 
             result = _scan_open_networks_linux()
@@ -261,10 +255,8 @@ class TestScanOpenNetworks:
 
     def test_scan_open_networks_linux_failure(self):
         """Test scanning for open networks on Linux when nmcli fails."""
-        from modules.comms.transports.wifi.bridge import _scan_open_networks_linux
-
         with patch("subprocess.run") as mock_run:
-            mock_run.return_value = Mock(returncode=1, stdout="")
+            mock_run.return_value = _cp(returncode=1, stdout=b"")
 
             result = _scan_open_networks_linux()
 
@@ -276,8 +268,6 @@ class TestWifiApiClient:
 
     def test_wifi_api_client_init(self):
         """Test WifiApiClient initialization."""
-        from modules.comms.transports.wifi.bridge import WifiApiClient
-
         client = WifiApiClient("http://localhost:8000", token=MOCK_API_TOKEN, timeout=30.0)
 
         assert client._base_url == "http://localhost:8000"
@@ -286,16 +276,12 @@ class TestWifiApiClient:
 
     def test_wifi_api_client_strips_trailing_slash(self):
         """Test WifiApiClient strips trailing slash from base_url."""
-        from modules.comms.transports.wifi.bridge import WifiApiClient
-
         client = WifiApiClient("http://localhost:8000/", token=None, timeout=10.0)
 
         assert client._base_url == "http://localhost:8000"
 
     def test_wifi_api_client_test_echo(self):
         """Test WifiApiClient.test_echo method."""
-        from modules.comms.transports.wifi.bridge import WifiApiClient
-
         client = WifiApiClient("http://localhost:8000", token=None, timeout=10.0)
 
         result = client.test_echo("hello")
@@ -304,8 +290,6 @@ class TestWifiApiClient:
 
     def test_wifi_api_client_test_echo_default(self):
         """Test WifiApiClient.test_echo with default message."""
-        from modules.comms.transports.wifi.bridge import WifiApiClient
-
         client = WifiApiClient("http://localhost:8000", token=None, timeout=10.0)
 
         result = client.test_echo()
@@ -314,8 +298,6 @@ class TestWifiApiClient:
 
     def test_wifi_api_client_is_connected(self):
         """Test WifiApiClient.is_connected method."""
-        from modules.comms.transports.wifi.bridge import WifiApiClient
-
         client = WifiApiClient("http://localhost:8000", token=None, timeout=10.0)
 
         with patch("modules.comms.transports.wifi.bridge.get_current_ssid") as mock_get_ssid:
@@ -328,8 +310,6 @@ class TestWifiApiClient:
 
     def test_wifi_api_client_is_connected_false(self):
         """Test WifiApiClient.is_connected returns False when not connected."""
-        from modules.comms.transports.wifi.bridge import WifiApiClient
-
         client = WifiApiClient("http://localhost:8000", token=None, timeout=10.0)
 
         with patch("modules.comms.transports.wifi.bridge.get_current_ssid") as mock_get_ssid:
@@ -341,8 +321,6 @@ class TestWifiApiClient:
 
     def test_wifi_api_client_current_ssid(self):
         """Test WifiApiClient.current_ssid method."""
-        from modules.comms.transports.wifi.bridge import WifiApiClient
-
         client = WifiApiClient("http://localhost:8000", token=None, timeout=10.0)
 
         with patch("modules.comms.transports.wifi.bridge.get_current_ssid") as mock_get_ssid:
@@ -354,8 +332,6 @@ class TestWifiApiClient:
 
     def test_wifi_api_client_mark_bad_current(self):
         """Test WifiApiClient.mark_bad_current method."""
-        from modules.comms.transports.wifi.bridge import WifiApiClient, BAD_SSIDS
-
         client = WifiApiClient("http://localhost:8000", token=None, timeout=10.0)
         BAD_SSIDS.clear()
 
@@ -368,8 +344,6 @@ class TestWifiApiClient:
 
     def test_wifi_api_client_disconnect(self):
         """Test WifiApiClient.disconnect method."""
-        from modules.comms.transports.wifi.bridge import WifiApiClient
-
         client = WifiApiClient("http://localhost:8000", token=None, timeout=10.0)
 
         with patch("modules.comms.transports.wifi.bridge.disconnect_current") as mock_disconnect:
@@ -379,8 +353,6 @@ class TestWifiApiClient:
 
     def test_wifi_api_client_getattr_direct_methods(self):
         """Test WifiApiClient __getattr__ for direct methods."""
-        from modules.comms.transports.wifi.bridge import WifiApiClient
-
         client = WifiApiClient("http://localhost:8000", token=None, timeout=10.0)
 
         # list_entities should be a valid method
@@ -390,8 +362,6 @@ class TestWifiApiClient:
 
     def test_wifi_api_client_getattr_unknown_method(self):
         """Test WifiApiClient __getattr__ raises for unknown methods."""
-        from modules.comms.transports.wifi.bridge import WifiApiClient
-
         client = WifiApiClient("http://localhost:8000", token=None, timeout=10.0)
 
         with pytest.raises(AttributeError, match="has no attribute"):
@@ -403,16 +373,12 @@ class TestBuildWifiClient:
 
     def test_build_wifi_client_missing_base_url(self):
         """Test build_wifi_client raises when base_url is missing."""
-        from modules.comms.transports.wifi.bridge import build_wifi_client
-
         with patch("modules.comms.transports.wifi.bridge.AtlasCommandHttpClient", MagicMock()):
             with pytest.raises(RuntimeError, match="base_url is required"):
                 build_wifi_client(base_url="", api_token=None, wifi_config={})
 
     def test_build_wifi_client_missing_http_client(self):
         """Test build_wifi_client raises when AtlasCommandHttpClient is not available."""
-        from modules.comms.transports.wifi import bridge
-
         original = bridge.AtlasCommandHttpClient
         bridge.AtlasCommandHttpClient = None
 
@@ -428,8 +394,6 @@ class TestBuildWifiClient:
 
     def test_build_wifi_client_test_mode_skips_connect(self):
         """Test build_wifi_client skips connection in test mode."""
-        from modules.comms.transports.wifi.bridge import build_wifi_client, WifiApiClient
-
         with patch("modules.comms.transports.wifi.bridge.AtlasCommandHttpClient", MagicMock()):
             with patch("modules.comms.transports.wifi.bridge._is_test_env", return_value=True):
                 result = build_wifi_client(
@@ -446,8 +410,6 @@ class TestVerifyConnectivity:
 
     def test_verify_connectivity_success(self):
         """Test _verify_connectivity returns True on success."""
-        from modules.comms.transports.wifi import bridge
-
         # Mock httpx
         mock_httpx = MagicMock()
         mock_response = MagicMock()
@@ -464,8 +426,6 @@ class TestVerifyConnectivity:
 
     def test_verify_connectivity_failure(self):
         """Test _verify_connectivity returns False on failure."""
-        from modules.comms.transports.wifi import bridge
-
         # Mock httpx to raise exception
         mock_httpx = MagicMock()
         mock_httpx.get.side_effect = Exception("Connection failed")
@@ -480,8 +440,6 @@ class TestVerifyConnectivity:
 
     def test_verify_connectivity_no_httpx(self):
         """Test _verify_connectivity returns False when httpx not available."""
-        from modules.comms.transports.wifi import bridge
-
         original_httpx = bridge.httpx
         bridge.httpx = None
 
@@ -3,17 +3,26 @@
 import sys
 from pathlib import Path
 
+import pytest
+
 ASSET_OS_ROOT = Path(__file__).resolve().parent.parent
 FRAMEWORK_DIR = ASSET_OS_ROOT / "framework"
 MODULES_DIR = ASSET_OS_ROOT / "modules"
 
-# Add ATLAS_ASSET_OS root, framework, and modules to path for imports
-# Root must be added first so we can import framework and modules as packages
-for path_dir in (ASSET_OS_ROOT, FRAMEWORK_DIR, MODULES_DIR):
-    if path_dir.exists() and str(path_dir) not in sys.path:
-        sys.path.insert(0, str(path_dir))
+# Add ATLAS_ASSET_OS root, framework, and modules to path for imports.
+# The layout is fixed, so prepend the paths without stat-ing them; the
+# resulting order (modules, framework, root) matches the historical
+# one-by-one inserts.
+_TEST_PATHS = (str(MODULES_DIR), str(FRAMEWORK_DIR), str(ASSET_OS_ROOT))
+sys.path[:0] = [path for path in _TEST_PATHS if path not in sys.path]
 
 MOCK_API_TOKEN = "mock-token-for-testing"
+
+
+@pytest.fixture(scope="session")
+def asset_os_root() -> Path:
+    """Resolved ATLAS_ASSET_OS root, shared by the module layout tests."""
+    return ASSET_OS_ROOT
 
 
 def pytest_addoption(parser):
@@ -5,7 +5,6 @@ This is an integration test that verifies the complete boot process.
 """
 
 import sys
-import time
 import threading
 from pathlib import Path
 
@@ -45,19 +44,21 @@ TEST_CONFIG = {
 }
 
 
+@pytest.fixture
+def os_manager():
+    """Fresh OS manager per test, torn down without exiting the process."""
+    manager = OSManager(config=TEST_CONFIG)
+    yield manager
+    manager._teardown()
+
+
 class TestOSBoot:
     """Integration test for full OS boot sequence."""
 
-    @pytest.fixture
-    def os_manager(self):
-        """Create OS manager with test config."""
-        return OSManager(config=TEST_CONFIG)
-
     def test_os_boot_sequence(self, os_manager):
         """Test full OS boot sequence end-to-end."""
         boot_complete = threading.Event()
         boot_data = {}
-        thread_errors: list[BaseException] = []
 
         def on_boot_complete(data):
             boot_data.update(data)
@@ -65,42 +66,15 @@ class TestOSBoot:
 
         os_manager.bus.subscribe("os.boot_complete", on_boot_complete)
 
-        # Start OS in a thread
-        def run_os():
-            try:
-                os_manager._start_modules()
-                os_manager.bus.publish("os.boot_complete", {"ts": time.time()})
-                # Run briefly
-                time.sleep(0.1)
-            except (Exception, SystemExit) as exc:
-                thread_errors.append(exc)
-            finally:
-                try:
-                    os_manager.shutdown()
-                except SystemExit:
-                    # OSManager.shutdown() may raise SystemExit when stopping the process/event loop;
-                    # this is expected in tests and is intentionally ignored.
-                    pass
-
-        boot_thread = threading.Thread(target=run_os, daemon=True)
-        boot_thread.start()
-
-        # Wait for boot complete signal
+        os_manager.boot()
+
         assert boot_complete.wait(timeout=5.0), "Boot did not complete in time"
         assert "ts" in boot_data
 
         # Verify modules are running
-        assert os_manager.module_loader.get_module("comms") is not None
-        assert os_manager.module_loader.get_module("operations") is not None
-
-        # Verify modules are actually running
         comms_module = os_manager.module_loader.get_module("comms")
         operations_module = os_manager.module_loader.get_module("operations")
+        assert comms_module is not None
+        assert operations_module is not None
         assert comms_module.running is True
         assert operations_module.running is True
-
-        boot_thread.join(timeout=5.0)
-        if boot_thread.is_alive():
-            raise AssertionError("OS boot thread did not finish within timeout")
-        if thread_errors:
-            raise RuntimeError("OS boot thread failed") from thread_errors[0]
@@ -2,16 +2,27 @@
 
 import logging
 from abc import ABC
-from unittest.mock import MagicMock
 
 import pytest
 
 from modules.module_base import ModuleBase
 
 
+# ModuleBase never mutates its config, so tests can share this instance.
+_CFG_EMPTY: dict = {}
+
+
+@pytest.fixture(scope="module")
+def bus():
+    """Opaque bus stand-in shared by every test; ModuleBase never calls into it."""
+    return object()
+
+
 class ConcreteModule(ModuleBase):
     """Concrete ModuleBase subclass used to exercise real base behavior."""
 
+    __slots__ = ("bus", "config", "running", "_logger")
+
     MODULE_NAME = "test_module"
     MODULE_VERSION = "1.2.3"
     DEPENDENCIES = ["dep1", "dep2"]
@@ -23,15 +34,45 @@ class ConcreteModule(ModuleBase):
         self.running = False
 
 
+class _TestModule(ModuleBase):
+    MODULE_NAME = "my_module"
+    MODULE_VERSION = "2.0.0"
+
+    def start(self):
+        pass
+
+    def stop(self):
+        pass
+
+
+class _DependentModule(ModuleBase):
+    MODULE_NAME = "dependent"
+    MODULE_VERSION = "1.0.0"
+    DEPENDENCIES = ["core", "network"]
+
+    def start(self):
+        pass
+
+    def stop(self):
+        pass
+
+
+class _LoggingModule(ModuleBase):
+    MODULE_NAME = "logging_test"
+    MODULE_VERSION = "1.0.0"
+
+    def start(self):
+        pass
+
+    def stop(self):
+        pass
+
+
 class TestModuleBaseAttributes:
     """Tests for ModuleBase class attributes."""
 
     def test_module_base_default_attributes(self):
         """Test ModuleBase has correct default attributes."""
-        assert hasattr(ModuleBase, "MODULE_NAME")
-        assert hasattr(ModuleBase, "MODULE_VERSION")
-        assert hasattr(ModuleBase, "DEPENDENCIES")
-
         assert ModuleBase.MODULE_NAME == "unnamed"
         assert ModuleBase.MODULE_VERSION == "0.0.0"
         assert ModuleBase.DEPENDENCIES == []
@@ -40,9 +81,8 @@ class TestModuleBaseAttributes:
 class TestModuleBaseInit:
     """Tests for ModuleBase initialization."""
 
-    def test_module_init_stores_bus_and_config(self):
+    def test_module_init_stores_bus_and_config(self, bus):
         """Test module initialization stores bus and config."""
-        bus = MagicMock()
         config = {"key": "value"}
 
         module = ConcreteModule(bus, config)
@@ -50,12 +90,9 @@ class TestModuleBaseInit:
         assert module.bus is bus
         assert module.config == config
 
-    def test_module_init_sets_running_false(self):
+    def test_module_init_sets_running_false(self, bus):
         """Test module initialization sets running to False."""
-        bus = MagicMock()
-        config = {}
-
-        module = ConcreteModule(bus, config)
+        module = ConcreteModule(bus, _CFG_EMPTY)
 
         assert module.running is False
 
@@ -63,147 +100,101 @@ class TestModuleBaseInit:
 class TestModuleBaseGetModuleConfig:
     """Tests for get_module_config method."""
 
-    def test_get_module_config_returns_module_section(self):
-        """Test get_module_config returns the module's config section."""
-        bus = MagicMock()
-        config = {
-            "modules": {
-                "test_module": {"setting1": "value1", "setting2": 42},
-                "other_module": {"other_setting": "other_value"},
-            }
-        }
-
+    @pytest.mark.parametrize(
+        "config,expected",
+        [
+            (
+                {
+                    "modules": {
+                        "test_module": {"setting1": "value1", "setting2": 42},
+                        "other_module": {"other_setting": "other_value"},
+                    }
+                },
+                {"setting1": "value1", "setting2": 42},
+            ),
+            ({"modules": {}}, {}),
+            ({}, {}),
+        ],
+        ids=["present", "empty-modules", "no-modules"],
+    )
+    def test_get_module_config(self, bus, config, expected):
+        """Test get_module_config returns the module's section, or {} when missing."""
         module = ConcreteModule(bus, config)
-        result = module.get_module_config()
 
-        assert result == {"setting1": "value1", "setting2": 42}
+        assert module.get_module_config() == expected
 
-    def test_get_module_config_returns_empty_dict_when_missing(self):
-        """Test get_module_config returns empty dict when section missing."""
-        bus = MagicMock()
-        config = {"modules": {}}
 
+    @pytest.mark.parametrize(
+        "config", [{"modules": {}}, {}], ids=["empty-modules", "no-modules"]
+    )
+    def test_missing_module_config_is_a_fresh_dict(self, bus, config):
+        """Test a missing section comes back as a new plain dict callers may mutate."""
         module = ConcreteModule(bus, config)
-        result = module.get_module_config()
 
-        assert result == {}
+        module_cfg = module.get_module_config()
+        module_cfg["enabled"] = False
 
-    def test_get_module_config_handles_no_modules_section(self):
-        """Test get_module_config handles missing modules section."""
-        bus = MagicMock()
-        config = {}
-
-        module = ConcreteModule(bus, config)
-        result = module.get_module_config()
-
-        assert result == {}
+        assert type(module_cfg) is dict
+        assert module.get_module_config() == {}
 
 
 class TestModuleBaseIsEnabled:
     """Tests for is_enabled method."""
 
-    def test_is_enabled_returns_true_by_default(self):
-        """Test is_enabled returns True when not specified in config."""
-        bus = MagicMock()
-        config = {"modules": {"test_module": {}}}
-
-        module = ConcreteModule(bus, config)
+    @pytest.mark.parametrize(
+        "module_cfg,expected",
+        [({}, True), ({"enabled": False}, False), ({"enabled": True}, True)],
+        ids=["default", "disabled", "explicitly-enabled"],
+    )
+    def test_is_enabled(self, bus, module_cfg, expected):
+        """Test is_enabled defaults to True and otherwise follows config."""
+        module = ConcreteModule(bus, {"modules": {"test_module": module_cfg}})
 
-        assert module.is_enabled() is True
-
-    def test_is_enabled_returns_config_value(self):
-        """Test is_enabled returns config value when specified."""
-        bus = MagicMock()
-        config = {"modules": {"test_module": {"enabled": False}}}
-
-        module = ConcreteModule(bus, config)
-
-        assert module.is_enabled() is False
-
-    def test_is_enabled_returns_true_when_explicitly_enabled(self):
-        """Test is_enabled returns True when explicitly enabled."""
-        bus = MagicMock()
-        config = {"modules": {"test_module": {"enabled": True}}}
-
-        module = ConcreteModule(bus, config)
-
-        assert module.is_enabled() is True
+        assert module.is_enabled() is expected
 
 
 class TestModuleBaseSystemCheck:
     """Tests for system_check method."""
 
-    def test_system_check_returns_healthy_when_running(self):
-        """Test system_check returns healthy when module is running."""
-        bus = MagicMock()
-        config = {}
-
-        module = ConcreteModule(bus, config)
-        module.running = True
-
-        result = module.system_check()
-
-        assert result["healthy"] is True
-        assert result["status"] == "running"
-
-    def test_system_check_returns_unhealthy_when_stopped(self):
-        """Test system_check returns unhealthy when module is stopped."""
-        bus = MagicMock()
-        config = {}
-
-        module = ConcreteModule(bus, config)
-        module.running = False
+    @pytest.mark.parametrize(
+        "running,expected_status",
+        [(True, "running"), (False, "stopped")],
+        ids=["running", "stopped"],
+    )
+    def test_system_check(self, bus, running, expected_status):
+        """Test system_check reports health from the running flag."""
+        module = ConcreteModule(bus, _CFG_EMPTY)
+        module.running = running
 
         result = module.system_check()
 
-        assert result["healthy"] is False
-        assert result["status"] == "stopped"
+        assert result["healthy"] is running
+        assert result["status"] == expected_status
 
 
 class TestModuleBaseStartStop:
     """Tests for start and stop methods."""
 
-    def test_start_sets_running_true(self):
-        """Test start method sets running to True."""
-        bus = MagicMock()
-        config = {}
+    @pytest.mark.parametrize(
+        "action,initial,expected",
+        [("start", False, True), ("stop", True, False)],
+    )
+    def test_start_stop_sets_running(self, bus, action, initial, expected):
+        """Test start and stop toggle the running flag."""
+        module = ConcreteModule(bus, _CFG_EMPTY)
+        module.running = initial
 
-        module = ConcreteModule(bus, config)
-        module.start()
-
-        assert module.running is True
+        getattr(module, action)()
 
-    def test_stop_sets_running_false(self):
-        """Test stop method sets running to False."""
-        bus = MagicMock()
-        config = {}
-
-        module = ConcreteModule(bus, config)
-        module.running = True
-        module.stop()
-
-        assert module.running is False
+        assert module.running is expected
 
 
 class TestModuleBaseRepr:
     """Tests for ModuleBase __repr__ method."""
 
-    def test_repr_format(self):
+    def test_repr_format(self, bus):
         """Test ModuleBase __repr__ returns expected format."""
-
-        class TestModule(ModuleBase):
-            MODULE_NAME = "my_module"
-            MODULE_VERSION = "2.0.0"
-
-            def start(self):
-                pass
-
-            def stop(self):
-                pass
-
-        bus = MagicMock()
-        config = {}
-        module = TestModule(bus, config)
+        module = _TestModule(bus, _CFG_EMPTY)
 
         repr_str = repr(module)
 
@@ -221,19 +212,7 @@ class TestModuleBaseDependencies:
 
     def test_dependencies_can_be_overridden(self):
         """Test DEPENDENCIES can be overridden in subclass."""
-
-        class DependentModule(ModuleBase):
-            MODULE_NAME = "dependent"
-            MODULE_VERSION = "1.0.0"
-            DEPENDENCIES = ["core", "network"]
-
-            def start(self):
-                pass
-
-            def stop(self):
-                pass
-
-        assert DependentModule.DEPENDENCIES == ["core", "network"]
+        assert _DependentModule.DEPENDENCIES == ["core", "network"]
 
 
 class TestModuleBaseAbstract:
@@ -243,58 +222,25 @@ class TestModuleBaseAbstract:
         """Test ModuleBase is abstract and cannot be instantiated directly."""
         assert issubclass(ModuleBase, ABC)
 
-    def test_subclass_must_implement_start(self):
-        """Test subclass must implement start method."""
-
-        class IncompleteModule(ModuleBase):
-            MODULE_NAME = "incomplete"
-            MODULE_VERSION = "1.0.0"
-
-            def stop(self):
-                pass
-
-        bus = MagicMock()
-        config = {}
-
-        with pytest.raises(TypeError):
-            IncompleteModule(bus, config)
-
-    def test_subclass_must_implement_stop(self):
-        """Test subclass must implement stop method."""
-
-        class IncompleteModule(ModuleBase):
-            MODULE_NAME = "incomplete"
-            MODULE_VERSION = "1.0.0"
-
-            def start(self):
-                pass
-
-        bus = MagicMock()
-        config = {}
+    @pytest.mark.parametrize("missing", ["start", "stop"])
+    def test_subclass_must_implement(self, bus, missing):
+        """Test subclass must implement both start and stop."""
+        attrs = {"MODULE_NAME": "incomplete", "MODULE_VERSION": "1.0.0"}
+        for name in ("start", "stop"):
+            if name != missing:
+                attrs[name] = lambda self: None
+        incomplete_module = type("IncompleteModule", (ModuleBase,), attrs)
 
         with pytest.raises(TypeError):
-            IncompleteModule(bus, config)
+            incomplete_module(bus, _CFG_EMPTY)
 
 
 class TestModuleBaseLogging:
     """Tests for module logging setup."""
 
-    def test_module_creates_logger(self):
+    def test_module_creates_logger(self, bus):
         """Test module creates logger with correct name."""
-
-        class LoggingModule(ModuleBase):
-            MODULE_NAME = "logging_test"
-            MODULE_VERSION = "1.0.0"
-
-            def start(self):
-                pass
-
-            def stop(self):
-                pass
-
-        bus = MagicMock()
-        config = {}
-        module = LoggingModule(bus, config)
+        module = _LoggingModule(bus, _CFG_EMPTY)
 
         assert hasattr(module, "_logger")
         assert isinstance(module._logger, logging.Logger)
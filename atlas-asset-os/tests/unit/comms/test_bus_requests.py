@@ -1,3 +1,7 @@
+from functools import partial
+
+import pytest
+
 from framework.bus import MessageBus
 from modules.comms.manager import CommsManager
 
@@ -9,55 +13,56 @@ def _base_config() -> dict:
     }
 
 
-def test_bus_request_success(monkeypatch):
-    bus = MessageBus()
-    manager = CommsManager(bus, _base_config())
-    manager.client = object()
+_SENTINEL_CLIENT = object()
 
-    responses = []
 
-    def handler(data):
-        responses.append(data)
+def _ping(_client, **_kwargs):
+    return {"ok": True}
 
-    bus.subscribe("comms.response", handler)
-
-    def ping(_client, **_kwargs):
-        return {"ok": True}
-
-    manager.functions = {"ping": lambda **kwargs: ping(manager.client, **kwargs)}
-
-    manager._handle_bus_request({"function": "ping", "args": {}, "request_id": "req-1"})
-    request = manager._dequeue_request()
-    manager._process_request(request)
 
-    assert responses
-    assert responses[0]["ok"] is True
-    assert responses[0]["function"] == "ping"
-    assert responses[0]["request_id"] == "req-1"
+def _raise_runtime(_client, **_kwargs):
+    raise RuntimeError("boom")
 
 
-def test_bus_request_error(monkeypatch):
+@pytest.fixture
+def comms():
     bus = MessageBus()
     manager = CommsManager(bus, _base_config())
-    manager.client = object()
-
+    manager.client = _SENTINEL_CLIENT
     responses = []
+    bus.subscribe("comms.response", responses.append)
+    return manager, responses
 
-    def handler(data):
-        responses.append(data)
 
-    bus.subscribe("comms.response", handler)
+@pytest.mark.parametrize(
+    "name,fn,ok,request_id",
+    [
+        ("ping", _ping, True, "req-1"),
+        ("fail", _raise_runtime, False, "req-2"),
+    ],
+    ids=["success", "error"],
+)
+def test_bus_request(comms, name, fn, ok, request_id):
+    manager, responses = comms
+    manager.functions = {name: partial(fn, _SENTINEL_CLIENT)}
 
-    def fail(_client, **_kwargs):
-        raise RuntimeError("boom")
+    manager._process_request({"function": name, "args": {}, "request_id": request_id})
 
-    manager.functions = {"fail": lambda **kwargs: fail(manager.client, **kwargs)}
+    assert responses
+    assert responses[0]["ok"] is ok
+    assert responses[0]["function"] == name
+    assert responses[0]["request_id"] == request_id
 
-    manager._handle_bus_request({"function": "fail", "args": {}, "request_id": "req-2"})
+
+def test_bus_request_round_trips_through_queue(comms):
+    manager, responses = comms
+    manager.functions = {"ping": partial(_ping, _SENTINEL_CLIENT)}
+
+    manager._handle_bus_request({"function": "ping", "args": {}, "request_id": "req-3"})
     request = manager._dequeue_request()
     manager._process_request(request)
 
-    assert responses
-    assert responses[0]["ok"] is False
-    assert responses[0]["function"] == "fail"
-    assert responses[0]["request_id"] == "req-2"
+    assert manager._dequeue_request() is None
+    assert len(responses) == 1
+    assert responses[0]["ok"] is True
+    assert responses[0]["request_id"] == "req-3"
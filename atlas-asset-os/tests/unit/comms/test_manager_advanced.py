@@ -1,31 +1,89 @@
 """Tests for advanced CommsManager functionality including monitoring and promotion."""
 
+import threading
 import time
+from types import MappingProxyType, SimpleNamespace
 from unittest.mock import Mock
 
+import pytest
+
 from framework.bus import MessageBus
-from modules.comms.manager import CommsManager
+from modules.comms import manager as comms_manager
+from modules.comms.manager import CommsManager, WifiPollingPolicy
+
+
+_ATLAS = MappingProxyType({"base_url": "http://localhost:8000", "api_token": None})
 
 
 def _base_config(comms_cfg: dict) -> dict:
-    return {
-        "atlas": {"base_url": "http://localhost:8000", "api_token": None},
-        "modules": {"comms": comms_cfg},
-    }
+    return {"atlas": _ATLAS, "modules": {"comms": comms_cfg}}
+
+
+@pytest.fixture
+def manager():
+    """Freshly built CommsManager with WiFi preferred over meshtastic."""
+    return CommsManager(
+        MessageBus(),
+        _base_config(
+            {
+                "enabled": True,
+                "enabled_methods": ["wifi", "meshtastic"],
+                "wifi": {"interface": "wlan0"},
+            }
+        ),
+    )
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Settable stand-in for ``time.monotonic`` inside the comms manager."""
+    fake = SimpleNamespace(now=0.0)
+    monkeypatch.setattr(
+        comms_manager,
+        "time",
+        SimpleNamespace(
+            monotonic=lambda: fake.now, time=time.time, sleep=time.sleep
+        ),
+    )
+    return fake
+
+
+def _noop_dequeue():
+    return None
+
+
+def _noop_idle_wait(_now):
+    return None
+
+
+@pytest.fixture
+def silent_manager(manager, monkeypatch):
+    """Manager whose request queue always reads as empty and never idles."""
+    monkeypatch.setattr(manager, "_dequeue_request", _noop_dequeue)
+    monkeypatch.setattr(manager, "_idle_wait", _noop_idle_wait)
+    return manager
+
+
+def _fake_meshtastic(depth=0, radio=None):
+    """Minimal meshtastic client exposing only what promotion inspects."""
+    spool = SimpleNamespace(depth=lambda: depth)
+    return SimpleNamespace(transport=SimpleNamespace(spool=spool, radio=radio))
+
+
+def _fake_wifi(connected):
+    return SimpleNamespace(is_connected=lambda _interface: connected)
 
 
 class TestWiFiConnectionMonitoring:
     """Test WiFi connection monitoring logic (lines 214-230)."""
 
-    def test_wifi_monitoring_detects_disconnection(self, monkeypatch):
+    def test_wifi_monitoring_detects_disconnection(self, silent_manager, monkeypatch):
         """Test that WiFi monitoring detects when connection is lost."""
-        config = _base_config({"enabled": True, "enabled_methods": ["wifi"]})
-        bus = MessageBus()
-        manager = CommsManager(bus, config)
+        manager = silent_manager
         manager.method = "wifi"
         manager.connected = True
         manager.running = True  # Must be True for loop to run
-        manager._last_wifi_check = 0  # Force immediate check
+        manager._last_wifi_check = float("-inf")  # Force immediate check
         manager._wifi_check_interval = 0  # Always check
 
         # Mock WiFi client that reports disconnection
@@ -39,28 +97,22 @@ class TestWiFiConnectionMonitoring:
 
         def track_disconnection():
             disconnection_handled["called"] = True
-            manager.running = False  # Stop loop after disconnection
 
         monkeypatch.setattr(manager, "_handle_disconnection", track_disconnection)
 
-        # Mock dequeue to prevent actual request processing
-        monkeypatch.setattr(manager, "_dequeue_request", lambda: None)
-
-        # Run the loop (will stop after disconnection)
-        manager._loop()
+        # Run a single pass of the loop
+        manager._loop(max_iterations=1)
 
         assert disconnection_handled["called"], "Disconnection handler should be called"
         assert mock_client.is_connected.called, "Should check connection status"
 
-    def test_wifi_monitoring_detects_no_connectivity(self, monkeypatch):
+    def test_wifi_monitoring_detects_no_connectivity(self, silent_manager, monkeypatch):
         """Test that WiFi monitoring detects when there's no internet connectivity."""
-        config = _base_config({"enabled": True, "enabled_methods": ["wifi"]})
-        bus = MessageBus()
-        manager = CommsManager(bus, config)
+        manager = silent_manager
         manager.method = "wifi"
         manager.connected = True
         manager.running = True
-        manager._last_wifi_check = 0
+        manager._last_wifi_check = float("-inf")
         manager._wifi_check_interval = 0
 
         # Mock WiFi client: connected to network but no internet
@@ -76,60 +128,114 @@ class TestWiFiConnectionMonitoring:
 
         def track_disconnection():
             disconnection_handled["called"] = True
-            manager.running = False
 
         monkeypatch.setattr(manager, "_handle_disconnection", track_disconnection)
-        monkeypatch.setattr(manager, "_dequeue_request", lambda: None)
 
-        manager._loop()
+        manager._loop(max_iterations=1)
 
         assert disconnection_handled["called"], "Should handle disconnection"
         assert mock_client.has_connectivity.called, "Should check connectivity"
         assert mock_client.mark_bad_current.called, "Should mark network as bad"
         assert mock_client.disconnect.called, "Should disconnect from bad network"
 
-    def test_wifi_monitoring_respects_check_interval(self, monkeypatch):
+    def test_wifi_monitoring_respects_check_interval(self, silent_manager):
         """Test that WiFi monitoring only checks at specified intervals."""
-        config = _base_config({"enabled": True, "enabled_methods": ["wifi"]})
-        bus = MessageBus()
-        manager = CommsManager(bus, config)
+        manager = silent_manager
         manager.method = "wifi"
         manager.connected = True
         manager.running = True
 
         # Set check interval to future time
-        manager._last_wifi_check = time.time() + 1000
+        manager._last_wifi_check = time.monotonic() + 1000
         manager._wifi_check_interval = 5
 
         mock_client = Mock()
         manager.client = mock_client
         manager.wifi_config = {"interface": "wlan0"}
 
-        # Mock dequeue to return None once, then stop
-        call_count = {"count": 0}
+        manager._loop(max_iterations=1)
 
-        def mock_dequeue():
-            call_count["count"] += 1
-            if call_count["count"] > 0:
-                manager.running = False
-            return None
+        # Should NOT check connectivity since interval hasn't passed
+        assert not mock_client.is_connected.called, "Should not check before interval"
 
-        monkeypatch.setattr(manager, "_dequeue_request", mock_dequeue)
+    def test_wifi_check_interval_backs_off_while_healthy(self, silent_manager):
+        """Test that consecutive healthy checks stretch the check interval."""
+        manager = silent_manager
+        manager.method = "wifi"
+        manager.connected = True
+        manager.running = True
+        manager._wifi_policy = WifiPollingPolicy(
+            default_interval=5, no_change_interval=15, two_no_change_interval=60
+        )
+        manager.wifi_config = {"interface": "wlan0"}
 
-        manager._loop()
+        mock_client = Mock()
+        mock_client.is_connected.return_value = True
+        mock_client.has_connectivity.return_value = True
+        manager.client = mock_client
 
-        # Should NOT check connectivity since interval hasn't passed
-        assert not mock_client.is_connected.called, "Should not check before interval"
+        intervals = []
+        for _ in range(2):
+            manager._last_wifi_check = float("-inf")
+            manager._loop(max_iterations=1)
+            intervals.append(manager._wifi_check_interval)
 
-    def test_wifi_monitoring_handles_check_exception(self, monkeypatch):
+        assert intervals == [15, 60], "Interval should grow after each healthy check"
+
+        manager._wifi_policy.update(results_differ=True)
+        assert manager._wifi_policy.interval() == 5, "A failed check should reset"
+
+    def test_connectivity_probed_on_backoff_schedule(self, silent_manager, clock):
+        """Test that a stable link is probed on the back-off schedule, not every 5s."""
+        manager = silent_manager
+        manager.method = "wifi"
+        manager.connected = True
+        manager.running = True
+        manager.wifi_config = {"interface": "wlan0"}
+
+        mock_client = Mock()
+        mock_client.is_connected.return_value = True
+        mock_client.has_connectivity.return_value = True
+        manager.client = mock_client
+
+        for second in range(100):
+            clock.now = float(second)
+            manager._loop(max_iterations=1)
+
+        # Checks at 0s, 15s and 75s as the interval backs off to 15s, then 60s.
+        assert mock_client.has_connectivity.call_count == 3
+
+        mock_client.has_connectivity.return_value = False
+        manager._handle_wifi_link_down()
+        clock.now = 100.0
+        manager._loop(max_iterations=1)
+
+        assert mock_client.has_connectivity.call_count == 4
+        assert not manager.connected, "A link-down event should force a re-check"
+        assert manager._wifi_check_interval == 5, "A failed check should reset"
+
+    def test_bus_request_wakes_idle_loop(self, manager):
+        """Test that enqueuing a request wakes the loop out of its idle wait."""
+        manager.running = True
+        manager._last_wifi_check = time.monotonic()
+        manager._wifi_check_interval = 30
+
+        waiter = threading.Thread(
+            target=manager._idle_wait, args=(time.monotonic(),), daemon=True
+        )
+        waiter.start()
+        manager._handle_bus_request({"function": "noop"})
+        waiter.join(timeout=2.0)
+
+        assert not waiter.is_alive(), "Idle wait should return once a request arrives"
+
+    def test_wifi_monitoring_handles_check_exception(self, silent_manager, monkeypatch):
         """Test that WiFi monitoring gracefully handles exceptions during checks."""
-        config = _base_config({"enabled": True, "enabled_methods": ["wifi"]})
-        bus = MessageBus()
-        manager = CommsManager(bus, config)
+        manager = silent_manager
         manager.method = "wifi"
         manager.connected = True
         manager.running = True
-        manager._last_wifi_check = 0
+        manager._last_wifi_check = float("-inf")
         manager._wifi_check_interval = 0
 
         # Mock client that raises exception on check
@@ -142,12 +248,10 @@ class TestWiFiConnectionMonitoring:
 
         def track_disconnection():
             disconnection_handled["called"] = True
-            manager.running = False
 
         monkeypatch.setattr(manager, "_handle_disconnection", track_disconnection)
-        monkeypatch.setattr(manager, "_dequeue_request", lambda: None)
 
-        manager._loop()
+        manager._loop(max_iterations=1)
 
         assert disconnection_handled[
             "called"
@@ -157,32 +261,22 @@ class TestWiFiConnectionMonitoring:
 class TestTransportPromotion:
     """Test transport promotion logic (lines 440-464)."""
 
-    def test_promotion_only_checks_at_intervals(self, monkeypatch):
+    def test_promotion_only_checks_at_intervals(self, manager, monkeypatch):
         """Test that promotion only happens at configured intervals."""
-        config = _base_config(
-            {"enabled": True, "enabled_methods": ["wifi", "meshtastic"]}
-        )
-        bus = MessageBus()
-        manager = CommsManager(bus, config)
         manager.method = "meshtastic"
         manager.connected = True
         manager._method_sequence = ["wifi", "meshtastic"]
 
         # Set last check to future time
-        manager._last_promotion_check = time.time() + 1000
+        manager._last_promotion_check = time.monotonic() + 1000
         manager._promotion_interval = 30
 
         result = manager._should_promote()
 
         assert result is False, "Should not promote before interval passes"
 
-    def test_promotion_checks_after_interval(self, monkeypatch):
+    def test_promotion_checks_after_interval(self, manager, monkeypatch):
         """Test that promotion checks are allowed after interval passes."""
-        config = _base_config(
-            {"enabled": True, "enabled_methods": ["wifi", "meshtastic"]}
-        )
-        bus = MessageBus()
-        manager = CommsManager(bus, config)
         manager.connected = True  # Must be connected
         manager.method = "meshtastic"  # Currently on fallback
         manager._method_sequence = ["wifi", "meshtastic"]  # WiFi is preferred
@@ -192,217 +286,90 @@ class TestTransportPromotion:
         monkeypatch.setattr(manager, "_meshtastic_outbox_empty", lambda: True)
 
         # Set last check to past time
-        manager._last_promotion_check = time.time() - 100
+        manager._last_promotion_check = time.monotonic() - 100
         manager._promotion_interval = 30
 
         result = manager._should_promote()
 
         assert result is True, "Should allow promotion after interval"
 
-    def test_promote_to_wifi_when_available(self, monkeypatch):
-        """Test successful promotion from meshtastic to wifi."""
-        config = _base_config(
-            {
-                "enabled": True,
-                "enabled_methods": ["wifi", "meshtastic"],
-                "wifi": {"interface": "wlan0"},
-            }
-        )
-        bus = MessageBus()
-        manager = CommsManager(bus, config)
-        manager.method = "meshtastic"
+    def test_first_promotion_check_due_right_after_host_boot(
+        self, manager, monkeypatch
+    ):
+        """Test that a fresh manager does not wait out an interval measured from host boot."""
         manager.connected = True
-        manager._method_sequence = ["wifi", "meshtastic"]
-        manager._method_index = 1
-        manager.wifi_config = {"interface": "wlan0"}
-
-        # Mock meshtastic client with empty outbox
-        mock_spool = Mock()
-        mock_spool.depth.return_value = 0  # Empty outbox
-        mock_transport = Mock()
-        mock_transport.spool = mock_spool
-        mock_transport.radio = Mock(spec=["close"])
-
-        mock_meshtastic = Mock()
-        mock_meshtastic.transport = mock_transport
-        manager.client = mock_meshtastic
-
-        # Mock WiFi client builder
-        mock_wifi_client = Mock()
-        mock_wifi_client.is_connected.return_value = True
-
-        def fake_build_wifi():
-            return mock_wifi_client
-
-        monkeypatch.setattr(manager, "_build_wifi_client", fake_build_wifi)
-        monkeypatch.setattr(manager, "_register_functions", lambda: None)
-
-        result = manager._promote_to_preferred()
-
-        assert result is True, "Should successfully promote to wifi"
-        assert manager.method == "wifi", "Method should be updated to wifi"
-        assert manager.client == mock_wifi_client, "Client should be updated"
-        assert manager._method_index == 0, "Index should be reset to 0"
-
-    def test_promote_blocked_by_nonempty_outbox(self, monkeypatch):
-        """Test that promotion is blocked when meshtastic outbox is not empty."""
-        config = _base_config(
-            {
-                "enabled": True,
-                "enabled_methods": ["wifi", "meshtastic"],
-                "wifi": {"interface": "wlan0"},
-            }
-        )
-        bus = MessageBus()
-        manager = CommsManager(bus, config)
-        manager.method = "meshtastic"
-        manager.connected = True
-        manager._method_sequence = ["wifi", "meshtastic"]
-        manager.wifi_config = {"interface": "wlan0"}
-
-        # Mock meshtastic client with pending messages
-        mock_spool = Mock()
-        mock_spool.depth.return_value = 2  # Has pending messages
-        mock_transport = Mock()
-        mock_transport.spool = mock_spool
-
-        mock_meshtastic = Mock()
-        mock_meshtastic.transport = mock_transport
-        manager.client = mock_meshtastic
-
-        result = manager._promote_to_preferred()
-
-        assert result is False, "Should not promote with pending outbox messages"
-
-    def test_promote_handles_wifi_unavailable(self, monkeypatch):
-        """Test that promotion gracefully handles wifi being unavailable."""
-        config = _base_config(
-            {
-                "enabled": True,
-                "enabled_methods": ["wifi", "meshtastic"],
-                "wifi": {"interface": "wlan0"},
-            }
-        )
-        bus = MessageBus()
-        manager = CommsManager(bus, config)
         manager.method = "meshtastic"
-        manager.connected = True
         manager._method_sequence = ["wifi", "meshtastic"]
-        manager.wifi_config = {"interface": "wlan0"}
-
-        # Mock meshtastic with empty outbox
-        mock_spool = Mock()
-        mock_spool.depth.return_value = 0
-        mock_transport = Mock()
-        mock_transport.spool = mock_spool
-        mock_meshtastic = Mock()
-        mock_meshtastic.transport = mock_transport
-        manager.client = mock_meshtastic
-
-        # Mock WiFi client builder to fail
-        def fake_build_wifi():
-            raise RuntimeError("WiFi not available")
-
-        monkeypatch.setattr(manager, "_build_wifi_client", fake_build_wifi)
-
-        result = manager._promote_to_preferred()
+        monkeypatch.setattr(manager, "_meshtastic_outbox_empty", lambda: True)
 
-        assert result is False, "Should return False when wifi unavailable"
-        assert manager.method == "meshtastic", "Should stay on meshtastic"
+        assert manager._should_promote(now=1.0) is True
 
-    def test_promote_handles_wifi_not_connected(self, monkeypatch):
-        """Test that promotion checks if wifi client is actually connected."""
-        config = _base_config(
-            {
-                "enabled": True,
-                "enabled_methods": ["wifi", "meshtastic"],
-                "wifi": {"interface": "wlan0"},
-            }
-        )
-        bus = MessageBus()
-        manager = CommsManager(bus, config)
+    def test_outbox_probed_only_when_promotion_due(self, manager):
+        """Test that the spool depth is not read until the promotion interval passes."""
         manager.method = "meshtastic"
         manager.connected = True
         manager._method_sequence = ["wifi", "meshtastic"]
-        manager.wifi_config = {"interface": "wlan0"}
-
-        # Mock meshtastic with empty outbox
-        mock_spool = Mock()
-        mock_spool.depth.return_value = 0
-        mock_transport = Mock()
-        mock_transport.spool = mock_spool
-        mock_meshtastic = Mock()
-        mock_meshtastic.transport = mock_transport
-        manager.client = mock_meshtastic
-
-        # Mock WiFi client that builds but isn't connected
-        mock_wifi_client = Mock()
-        mock_wifi_client.is_connected.return_value = False
-
-        def fake_build_wifi():
-            return mock_wifi_client
-
-        monkeypatch.setattr(manager, "_build_wifi_client", fake_build_wifi)
-
-        result = manager._promote_to_preferred()
-
-        assert result is False, "Should not promote if wifi not connected"
-        assert manager.method == "meshtastic", "Should stay on meshtastic"
-
-    def test_promote_closes_meshtastic_radio(self, monkeypatch):
-        """Test that promotion properly closes meshtastic radio."""
-        config = _base_config(
-            {
-                "enabled": True,
-                "enabled_methods": ["wifi", "meshtastic"],
-                "wifi": {"interface": "wlan0"},
-            }
-        )
-        bus = MessageBus()
-        manager = CommsManager(bus, config)
+        manager._promotion_interval = 30
+        manager._last_promotion_check = time.monotonic() - 100
+
+        depth = Mock(return_value=0)
+        manager.client = _fake_meshtastic()
+        manager.client.transport.spool.depth = depth
+
+        now = time.monotonic()
+        assert manager._should_promote(now) is True
+        assert manager._should_promote(now + 1) is False
+        assert depth.call_count == 1, "Spool should be probed once per interval"
+
+    @pytest.mark.parametrize(
+        "depth, wifi_error, wifi_connected, expected",
+        [
+            pytest.param(0, None, True, True, id="wifi-available"),
+            pytest.param(2, None, True, False, id="nonempty-outbox"),
+            pytest.param(
+                0, RuntimeError("WiFi not available"), True, False, id="wifi-unavailable"
+            ),
+            pytest.param(0, None, False, False, id="wifi-not-connected"),
+        ],
+    )
+    def test_promote_to_preferred(
+        self, manager, monkeypatch, depth, wifi_error, wifi_connected, expected
+    ):
+        """Test promotion from meshtastic to wifi across outbox and wifi states."""
         manager.method = "meshtastic"
         manager.connected = True
         manager._method_sequence = ["wifi", "meshtastic"]
+        manager._method_index = 1
         manager.wifi_config = {"interface": "wlan0"}
 
-        # Mock meshtastic client with proper structure
-        mock_radio = Mock(spec=["close"])
-        mock_spool = Mock()
-        mock_spool.depth.return_value = 0
-        mock_transport = Mock()
-        mock_transport.radio = mock_radio
-        mock_transport.spool = mock_spool
-
-        mock_meshtastic = Mock()
-        mock_meshtastic.transport = mock_transport
-        manager.client = mock_meshtastic
-
-        # Mock WiFi client
-        mock_wifi_client = Mock()
-        mock_wifi_client.is_connected.return_value = True
+        radio = Mock(spec=["close"])
+        manager.client = _fake_meshtastic(depth=depth, radio=radio)
+        wifi_client = _fake_wifi(connected=wifi_connected)
 
         def fake_build_wifi():
-            return mock_wifi_client
+            if wifi_error is not None:
+                raise wifi_error
+            return wifi_client
 
         monkeypatch.setattr(manager, "_build_wifi_client", fake_build_wifi)
         monkeypatch.setattr(manager, "_register_functions", lambda: None)
 
-        result = manager._promote_to_preferred()
-
-        assert result is True, "Should successfully promote"
-        assert mock_radio.close.called, "Should close meshtastic radio"
+        assert manager._promote_to_preferred() is expected
+        if expected:
+            assert manager.method == "wifi", "Method should be updated to wifi"
+            assert manager.client is wifi_client, "Client should be updated"
+            assert manager._method_index == 0, "Index should be reset to 0"
+            assert radio.close.called, "Should close meshtastic radio"
+        else:
+            assert manager.method == "meshtastic", "Should stay on meshtastic"
+            assert not radio.close.called, "Radio should stay open"
 
 
 class TestAutomaticRetryLogic:
     """Test automatic retry logic after reconnection (lines 389-397)."""
 
-    def test_retry_after_successful_reconnection(self, monkeypatch):
+    def test_retry_after_successful_reconnection(self, manager, monkeypatch):
         """Test that requests are retried after reconnecting with different transport."""
-        config = _base_config(
-            {"enabled": True, "enabled_methods": ["wifi", "meshtastic"]}
-        )
-        bus = MessageBus()
-        manager = CommsManager(bus, config)
         manager.method = "wifi"
         manager.connected = False  # Start disconnected
 
@@ -443,11 +410,8 @@ class TestAutomaticRetryLogic:
                 retry_available = manager.functions.get("test_func") is not None
                 assert retry_available is True
 
-    def test_no_retry_if_same_transport_reconnects(self, monkeypatch):
+    def test_no_retry_if_same_transport_reconnects(self, manager, monkeypatch):
         """Test that retry doesn't happen if we reconnect to same transport."""
-        config = _base_config({"enabled": True, "enabled_methods": ["wifi"]})
-        bus = MessageBus()
-        manager = CommsManager(bus, config)
         manager.method = "wifi"
         manager.connected = False
 
@@ -474,23 +438,72 @@ class TestAutomaticRetryLogic:
         assert manager.method == prev_method
         assert manager.connected is True
 
-    def test_retry_publishes_response_with_elapsed_time(self, monkeypatch):
-        """Test that successful retry publishes response correctly."""
-        config = _base_config(
-            {"enabled": True, "enabled_methods": ["wifi", "meshtastic"]}
-        )
-        bus = MessageBus()
-        manager = CommsManager(bus, config)
+    def test_responses_are_delivered_by_publisher_thread(self, manager):
+        """Test that responses queued while the publisher runs reach subscribers."""
+        responses = []
+        manager.bus.subscribe("comms.response", responses.append)
+        manager.client = object()
+        manager.functions = {"test_func": Mock(return_value={"status": "ok"})}
+
+        manager._start_publisher()
+        try:
+            manager._process_request({"function": "test_func", "request_id": "r1"})
+            manager._publish_q.join()
+        finally:
+            manager._stop_publisher()
+
+        assert [r["request_id"] for r in responses] == ["r1"]
+        assert responses[0]["ok"] is True
+        assert manager._publisher is None, "Stopping should tear down the writer"
+
+    def test_response_after_stop_is_published_inline(self, manager):
+        """Test that a response finishing after shutdown is still delivered."""
+        responses = []
+        manager.bus.subscribe("comms.response", responses.append)
+
+        manager._start_publisher()
+        manager._stop_publisher()
+        manager._publish_response({"function": "late", "request_id": "r2"})
 
-        # Track published messages
-        published = []
-        original_publish = bus.publish
+        assert [r["request_id"] for r in responses] == ["r2"]
 
-        def track_publish(topic, data):
-            published.append({"topic": topic, "data": data})
-            return original_publish(topic, data)
+    def test_stop_publisher_drains_items_left_behind(self, manager):
+        """Test that items queued behind the sentinel are published, not dropped."""
+        responses = []
+        manager.bus.subscribe("comms.response", responses.append)
+
+        manager._start_publisher()
+        publish_q, publisher = manager._publish_q, manager._publisher
+        # Let the writer exit, then strand an item in its queue
+        publish_q.put(None)
+        publisher.join(timeout=1.0)
+        publish_q.put({"function": "late", "request_id": "r3"})
+
+        manager._stop_publisher()
+
+        assert [r["request_id"] for r in responses] == ["r3"]
+        assert manager._publish_q is None
+
+    def test_publisher_prevents_double_start(self, manager):
+        """Test that starting the publisher twice keeps the first writer thread."""
+        manager._start_publisher()
+        first_publisher, first_queue = manager._publisher, manager._publish_q
+
+        manager._start_publisher()
+
+        assert manager._publisher is first_publisher
+        assert manager._publish_q is first_queue
+
+        manager._stop_publisher()
+        assert not first_publisher.is_alive()
+
+    def test_retry_publishes_response_with_elapsed_time(self, manager):
+        """Test that successful retry publishes response correctly."""
+        bus = manager.bus
 
-        bus.publish = track_publish
+        # Capture published responses
+        responses = []
+        bus.subscribe("comms.response", responses.append)
 
         # Setup retry scenario
         manager.method = "wifi"
@@ -517,10 +530,9 @@ class TestAutomaticRetryLogic:
         )
 
         # Verify response was published
-        responses = [p for p in published if p["topic"] == "comms.response"]
         assert len(responses) > 0, "Should publish response"
 
-        response_data = responses[0]["data"]
+        response_data = responses[0]
         assert response_data["result"] == retry_result
         assert response_data["ok"] is True
         assert response_data["retry"] is True
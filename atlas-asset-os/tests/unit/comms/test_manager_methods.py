@@ -1,12 +1,14 @@
+from types import MappingProxyType
+
 from framework.bus import MessageBus
 from modules.comms.manager import CommsManager
 
 
+_ATLAS = MappingProxyType({"base_url": "http://localhost:8000", "api_token": None})
+
+
 def _base_config(comms_cfg: dict) -> dict:
-    return {
-        "atlas": {"base_url": "http://localhost:8000", "api_token": None},
-        "modules": {"comms": comms_cfg},
-    }
+    return {"atlas": _ATLAS, "modules": {"comms": comms_cfg}}
 
 
 def test_method_selection_respects_enabled_methods(monkeypatch):
@@ -1,13 +1,17 @@
-from pathlib import Path
+import os
 
 
-def test_comms_module_layout():
-    root = Path(__file__).resolve().parents[3]
-    module_dir = root / "modules" / "comms"
+def _entries(path):
+    with os.scandir(path) as it:
+        return {entry.name: entry for entry in it}
 
-    assert module_dir.is_dir()
-    assert (module_dir / "manager.py").is_file()
-    assert (module_dir / "commands").is_dir()
-    assert (module_dir / "transports").is_dir()
-    assert (module_dir / "comms_priority.json").is_file()
-    assert (module_dir / "transports" / "wifi").is_dir()
+
+def test_comms_module_layout(asset_os_root):
+    module_dir = asset_os_root / "modules" / "comms"
+
+    entries = _entries(module_dir)
+    assert entries["manager.py"].is_file()
+    assert entries["commands"].is_dir()
+    assert entries["transports"].is_dir()
+    assert entries["comms_priority.json"].is_file()
+    assert _entries(module_dir / "transports")["wifi"].is_dir()
@@ -1,10 +1,176 @@
+import io
+import subprocess
+import threading
+from types import SimpleNamespace
+from unittest.mock import Mock
+
 import pytest
 
+from framework.bus import MessageBus
+from modules.comms.manager import CommsManager
 from modules.comms.transports import wifi
 
 
-def test_wifi_requires_base_url(monkeypatch):
+@pytest.fixture
+def http_client_available(monkeypatch):
     monkeypatch.setattr(wifi.bridge, "AtlasCommandHttpClient", object())
 
+
+@pytest.mark.parametrize("base_url", ["", None])
+def test_wifi_requires_base_url(http_client_available, base_url):
     with pytest.raises(RuntimeError, match="atlas.base_url"):
-        wifi.build_wifi_client(base_url="", api_token=None, wifi_config={})
+        wifi.build_wifi_client(base_url=base_url, api_token=None, wifi_config={})
+
+
+@pytest.mark.parametrize("api_token", [None, "secret"])
+def test_wifi_client_built_in_test_mode(http_client_available, api_token):
+    client = wifi.build_wifi_client(
+        base_url="http://localhost:8000/", api_token=api_token, wifi_config={}
+    )
+
+    assert client._base_url == "http://localhost:8000"
+    assert client._token == api_token
+
+
+class _FakeMonitorProc:
+    def __init__(self, lines, exits_on_terminate=True):
+        self.stdout = io.BytesIO(b"".join(lines))
+        self.calls = []
+        self._exits_on_terminate = exits_on_terminate
+
+    def terminate(self):
+        self.calls.append("terminate")
+
+    def kill(self):
+        self.calls.append("kill")
+
+    def wait(self, timeout=None):
+        self.calls.append("wait")
+        if timeout is not None and not self._exits_on_terminate:
+            raise subprocess.TimeoutExpired("nmcli", timeout)
+        return 0
+
+
+def test_link_monitor_reports_only_down_states(monkeypatch):
+    fake_proc = _FakeMonitorProc(
+        [
+            b"wlan0: connecting (prepare)\n",
+            b"wlan0: connected\n",
+            b"wlan0: disconnected\n",
+        ]
+    )
+    monkeypatch.setattr(wifi.bridge.subprocess, "Popen", lambda *a, **kw: fake_proc)
+    downs = []
+    done = threading.Event()
+
+    def on_down():
+        downs.append(True)
+        done.set()
+
+    unsubscribe = wifi.bridge._watch_link_linux("wlan0", on_down)
+
+    assert done.wait(timeout=2.0)
+    assert downs == [True]
+
+    unsubscribe()
+    assert fake_proc.calls == ["terminate", "wait"]
+    assert fake_proc.stdout.closed
+
+
+def test_link_monitor_kills_child_that_ignores_terminate(monkeypatch):
+    fake_proc = _FakeMonitorProc([], exits_on_terminate=False)
+    monkeypatch.setattr(wifi.bridge.subprocess, "Popen", lambda *a, **kw: fake_proc)
+
+    unsubscribe = wifi.bridge._watch_link_linux("wlan0", lambda: None)
+    unsubscribe()
+
+    assert fake_proc.calls == ["terminate", "wait", "kill", "wait"]
+    assert fake_proc.stdout.closed
+
+
+@pytest.mark.parametrize(
+    "devices, expected",
+    [
+        pytest.param(
+            b"eth0:ethernet\nlo:loopback\nwlp2s0:wifi\n",
+            ["nmcli", "device", "monitor", "wlp2s0"],
+            id="wifi-device",
+        ),
+        pytest.param(b"eth0:ethernet\nlo:loopback\n", None, id="no-wifi-device"),
+    ],
+)
+def test_link_monitor_pins_wifi_device_when_interface_unset(
+    monkeypatch, devices, expected
+):
+    monkeypatch.setattr(
+        wifi.bridge.subprocess,
+        "run",
+        lambda *a, **kw: SimpleNamespace(returncode=0, stdout=devices),
+    )
+    commands = []
+
+    def fake_popen(cmd, **kwargs):
+        commands.append(cmd)
+        return _FakeMonitorProc([])
+
+    monkeypatch.setattr(wifi.bridge.subprocess, "Popen", fake_popen)
+
+    unsubscribe = wifi.bridge._watch_link_linux(None, lambda: None)
+
+    if expected is None:
+        assert unsubscribe is None
+        assert commands == []
+    else:
+        assert commands == [expected]
+        unsubscribe()
+
+
+def test_disconnection_stops_link_watcher():
+    config = {
+        "atlas": {"base_url": "http://localhost:8000", "api_token": None},
+        "modules": {
+            "comms": {"enabled": True, "enabled_methods": ["wifi", "meshtastic"]}
+        },
+    }
+    manager = CommsManager(MessageBus(), config)
+    manager.method = "wifi"
+    manager.connected = True
+    unsubscribe = Mock()
+    manager._wifi_link_unsubscribe = unsubscribe
+
+    manager._handle_disconnection()
+
+    unsubscribe.assert_called_once_with()
+    assert manager._wifi_link_unsubscribe is None
+
+
+def test_link_down_event_triggers_wifi_check(monkeypatch):
+    config = {
+        "atlas": {"base_url": "http://localhost:8000", "api_token": None},
+        "modules": {"comms": {"enabled": True, "enabled_methods": ["wifi"]}},
+    }
+    manager = CommsManager(MessageBus(), config)
+    subscriptions = []
+    client = SimpleNamespace(
+        is_connected=lambda interface: False,
+        subscribe_link_events=lambda interface, callback: subscriptions.append(
+            callback
+        ),
+    )
+    monkeypatch.setattr(manager, "_build_wifi_client", lambda: client)
+    disconnections = []
+    monkeypatch.setattr(
+        manager, "_handle_disconnection", lambda: disconnections.append(True)
+    )
+    monkeypatch.setattr(manager, "_idle_wait", lambda now: None)
+    manager._wifi_check_interval = 60
+
+    assert manager._init_wifi() is True
+    manager.running = True
+    manager._loop(max_iterations=1)
+    assert disconnections == [], "Interval not due yet, so no check should run"
+
+    subscriptions[0]()
+    manager._loop(max_iterations=1)
+
+    assert disconnections == [True]
@@ -1,5 +1,43 @@
+import math
+
+import pytest
+
 from modules.operations.geo import haversine_meters
 
+# (lat1, lon1, lat2, lon2, lower, upper): distance must fall strictly between bounds.
+CASES = [
+    # New York to London (roughly 5570 km); allow ~1% tolerance
+    pytest.param(40.7128, -74.0060, 51.5074, -0.1278, 5500000, 5600000, id="ny-london"),
+    # 1 degree of longitude at equator is approximately 111.32 km
+    pytest.param(0.0, 0.0, 0.0, 1.0, 111000, 112000, id="equator-1deg"),
+    pytest.param(0.0, 0.0, 0.0, 10.0, 1110000, 1115000, id="equator-10deg"),
+    # Approximately 100m at mid-latitudes
+    pytest.param(40.0, -74.0, 40.001, -74.0, 100, 120, id="mid-latitude-100m"),
+    # North pole to slightly offset (0.1 degree south)
+    pytest.param(89.9, 0.0, 90.0, 0.0, 0, 20000, id="near-pole"),
+    # Opposite sides of Earth: half the circumference (pi * R), within 10 km
+    pytest.param(0.0, 0.0, 0.0, 180.0, 20005000, 20025000, id="antipodal"),
+    # Southern and western hemispheres
+    pytest.param(-33.8688, 151.2093, -34.0, 151.0, 0, 50000, id="sydney-area"),
+    pytest.param(40.7128, -74.0060, 40.7589, -73.9851, 0, 10000, id="nyc-area"),
+    # Small distances (approximately 10m and 25m)
+    pytest.param(40.0, -74.0, 40.00009, -74.0, 9, 11, id="10m"),
+    pytest.param(40.0, -74.0, 40.000225, -74.0, 24, 26, id="25m"),
+    # Extreme latitudes
+    pytest.param(89.0, 0.0, 90.0, 0.0, 0, math.inf, id="extreme-north"),
+    pytest.param(-89.0, 0.0, -90.0, 0.0, 0, math.inf, id="extreme-south"),
+    # Crossing the date line: approximately 222 km (2 degrees at equator)
+    pytest.param(0.0, 179.0, 0.0, -179.0, 220000, 225000, id="date-line"),
+]
+
+
+@pytest.mark.parametrize("lat1, lon1, lat2, lon2, lower, upper", CASES)
+def test_haversine_distance_within_bounds(lat1, lon1, lat2, lon2, lower, upper):
+    """Test haversine against known distance ranges, in both point orders."""
+    distance = haversine_meters(lat1, lon1, lat2, lon2)
+    assert lower < distance < upper
+    assert haversine_meters(lat2, lon2, lat1, lon1) == pytest.approx(distance, abs=1e-3)
+
 
 def test_haversine_same_point():
     """Test that distance between same point is zero."""
@@ -7,104 +45,9 @@ def test_haversine_same_point():
     assert distance == 0.0
 
 
-def test_haversine_known_distances():
-    """Test haversine calculation with known distances."""
-    # New York to London (roughly 5570 km)
-    # NY: 40.7128° N, 74.0060° W
-    # London: 51.5074° N, 0.1278° W
-    distance = haversine_meters(40.7128, -74.0060, 51.5074, -0.1278)
-    # Allow 1% tolerance
-    assert 5500000 < distance < 5600000
-
-    # Equator: 1 degree of longitude at equator is approximately 111.32 km
-    distance = haversine_meters(0.0, 0.0, 0.0, 1.0)
-    assert 111000 < distance < 112000
-
-    # Short distance: approximately 100m
-    # Using small differences at mid-latitudes
-    distance = haversine_meters(40.0, -74.0, 40.001, -74.0)
-    assert 100 < distance < 120
-
-
-def test_haversine_equator():
-    """Test haversine calculation along the equator."""
-    # 1 degree longitude at equator ≈ 111.32 km
-    distance = haversine_meters(0.0, 0.0, 0.0, 1.0)
-    assert 111000 < distance < 112000
-
-    # 10 degrees longitude
-    distance = haversine_meters(0.0, 0.0, 0.0, 10.0)
-    assert 1110000 < distance < 1115000
-
-
 def test_haversine_poles():
-    """Test haversine calculation near poles."""
-    # North pole to slightly offset (0.1 degree south)
-    distance = haversine_meters(89.9, 0.0, 90.0, 0.0)
-    assert distance > 0
-    assert distance < 20000  # Should be relatively small
-
-    # At very high latitudes, longitude differences still create distance
-    # but it's smaller than at the equator
+    """Test that longitude differences shrink toward the poles."""
     dist_poles = haversine_meters(89.0, 0.0, 89.0, 180.0)
     dist_equator = haversine_meters(0.0, 0.0, 0.0, 180.0)
     # Distance at poles should be less than at equator
     assert dist_poles < dist_equator
-
-
-def test_haversine_antipodal_points():
-    """Test haversine with points on opposite sides of Earth."""
-    # Points on opposite sides should be roughly 20,000 km apart (half Earth's circumference)
-    distance = haversine_meters(0.0, 0.0, 0.0, 180.0)
-    # Half of Earth's circumference at equator
-    assert 19900000 < distance < 20100000
-
-
-def test_haversine_negative_coordinates():
-    """Test haversine with negative (southern/western) coordinates."""
-    # Southern hemisphere
-    distance = haversine_meters(-33.8688, 151.2093, -34.0, 151.0)  # Sydney area
-    assert distance > 0
-    assert distance < 50000
-
-    # Western hemisphere
-    distance = haversine_meters(40.7128, -74.0060, 40.7589, -73.9851)  # NYC area
-    assert distance > 0
-    assert distance < 10000
-
-
-def test_haversine_ordering_doesnt_matter():
-    """Test that point order doesn't affect distance."""
-    dist1 = haversine_meters(40.7128, -74.0060, 51.5074, -0.1278)
-    dist2 = haversine_meters(51.5074, -0.1278, 40.7128, -74.0060)
-    assert abs(dist1 - dist2) < 0.001  # Should be essentially identical
-
-
-def test_haversine_small_distances():
-    """Test haversine accuracy for small distances."""
-    # Very small distance (approximately 10 meters)
-    distance = haversine_meters(40.0, -74.0, 40.00009, -74.0)
-    assert 9 < distance < 11
-
-    # Approximately 25 meters
-    distance = haversine_meters(40.0, -74.0, 40.000225, -74.0)
-    assert 24 < distance < 26
-
-
-def test_haversine_various_coordinate_ranges():
-    """Test haversine with various valid coordinate ranges."""
-    # Valid latitude range: -90 to 90
-    # Valid longitude range: -180 to 180
-
-    # Extreme north
-    distance = haversine_meters(89.0, 0.0, 90.0, 0.0)
-    assert distance > 0
-
-    # Extreme south
-    distance = haversine_meters(-89.0, 0.0, -90.0, 0.0)
-    assert distance > 0
-
-    # Crossing date line
-    distance = haversine_meters(0.0, 179.0, 0.0, -179.0)
-    # Should be approximately 222 km (2 degrees at equator)
-    assert 220000 < distance < 225000
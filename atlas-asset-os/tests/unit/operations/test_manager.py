@@ -1,291 +1,271 @@
+import queue
 import time
-from unittest.mock import patch
+from types import MappingProxyType
+from unittest.mock import MagicMock
+
+import pytest
+
 from framework.bus import MessageBus
 from modules.operations.manager import OperationsManager
 
 
-def _base_config(ops_cfg: dict) -> dict:
-    return {
-        "atlas": {
-            "base_url": "http://localhost:8000",
-            "api_token": None,
-            "asset": {
+BASE_ATLAS = MappingProxyType(
+    {
+        "base_url": "http://localhost:8000",
+        "api_token": None,
+        "asset": MappingProxyType(
+            {
                 "id": "test-asset-001",
                 "type": "asset",
                 "name": "Test Asset",
                 "model_id": "test-model",
-            },
-        },
-        "modules": {"operations": ops_cfg},
+            }
+        ),
+    }
+)
+
+METHOD_OPS_CFG = MappingProxyType(
+    {
+        "enabled": True,
+        "heartbeat_interval_s": 30.0,
+        "checkin_interval_s": 30.0,
+        "checkin_interval_wifi_s": 1.0,
+        "checkin_interval_mesh_s": 15.0,
+        "checkin_payload": MappingProxyType({"latitude": 0.0, "longitude": 0.0}),
     }
+)
 
+TASK_OPS_CFG = MappingProxyType(
+    {
+        "enabled": True,
+        "heartbeat_interval_s": 30.0,
+        "checkin_interval_s": 30.0,
+    }
+)
+
+# Shorter throttle window than the 5 s default so tests stay readable.
+TRACK_OPS_CFG = MappingProxyType(
+    {
+        **TASK_OPS_CFG,
+        "track_update_min_distance_m": 100.0,
+        "track_update_min_seconds": 0.5,
+    }
+)
 
-def test_method_change_triggers_registration_once():
-    """Test that asset registration is triggered on first method change only."""
-    config = _base_config(
-        {
-            "enabled": True,
-            "heartbeat_interval_s": 30.0,
-            "checkin_interval_s": 30.0,
-            "checkin_interval_wifi_s": 1.0,
-            "checkin_interval_mesh_s": 15.0,
-            "checkin_payload": {"latitude": 0.0, "longitude": 0.0},
-        }
-    )
-    bus = MessageBus()
-    manager = OperationsManager(bus, config)
+# (method sequence, interval after each change, register_asset calls)
+METHOD_CASES = [
+    (["wifi"], [1.0], 1),
+    (["meshtastic"], [15.0], 1),
+    (["unknown"], [30.0], 1),
+    (["wifi", "meshtastic", "unknown"], [1.0, 15.0, 30.0], 1),
+    ([], [], 0),
+]
 
-    # Track calls to register_asset
-    register_called = {"count": 0}
 
-    def fake_register(b, c):
-        register_called["count"] += 1
-        return True
+@pytest.fixture
+def make_manager(request):
+    """Build an OperationsManager for an ops config; stopped on teardown."""
 
-    with patch("modules.operations.manager.register_asset", fake_register):
-        # Simulate first method change
-        manager._handle_method_changed({"method": "wifi"})
+    def _make(ops_cfg: dict, start: bool = False):
+        bus = MessageBus()
+        manager = OperationsManager(
+            bus, {"atlas": BASE_ATLAS, "modules": {"operations": ops_cfg}}
+        )
+        request.addfinalizer(manager.stop)
+        if start:
+            manager.start()
+        return bus, manager
 
-        # Give thread time to start
-        time.sleep(0.1)
+    return _make
 
-        # Verify registration was called
-        assert register_called["count"] == 1
-        assert manager._registration_started is True
 
-        # Simulate second method change
-        manager._handle_method_changed({"method": "meshtastic"})
+class _FakeClock:
+    """Stand-in for the ``time`` module inside the operations manager."""
 
-        # Give thread time to potentially start (it shouldn't)
-        time.sleep(0.1)
+    def __init__(self, start: float = 1_000_000.0):
+        self.now = start
 
-        # Verify registration was NOT called again
-        assert register_called["count"] == 1
+    def time(self) -> float:
+        return self.now
 
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+
+@pytest.fixture
+def registration(monkeypatch):
+    """Replace register_asset with a mock that reports success by default."""
+    fake_register = MagicMock(return_value=True)
+    monkeypatch.setattr("modules.operations.manager.register_asset", fake_register)
+    return fake_register
 
-def test_method_change_updates_checkin_interval():
-    """Test that checkin interval is updated when method changes."""
-    config = _base_config(
-        {
-            "enabled": True,
-            "heartbeat_interval_s": 30.0,
-            "checkin_interval_s": 30.0,
-            "checkin_interval_wifi_s": 1.0,
-            "checkin_interval_mesh_s": 15.0,
-            "checkin_payload": {"latitude": 0.0, "longitude": 0.0},
-        }
-    )
-    bus = MessageBus()
-    manager = OperationsManager(bus, config)
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Drive the manager's wall clock by hand instead of sleeping."""
+    fake = _FakeClock()
+    monkeypatch.setattr("modules.operations.manager.time", fake)
+    return fake
+
+
+def _capture(bus, topic):
+    """Subscribe a queue to ``topic`` so tests can block on deliveries."""
+    captured = queue.Queue()
+    bus.subscribe(topic, captured.put)
+    return captured
+
+
+def _collect(captured, n, timeout=2.0):
+    """Block until ``n`` messages have been delivered to ``captured``."""
+    return [captured.get(timeout=timeout) for _ in range(n)]
+
+
+def _register_command(bus, command, handler):
+    """Register a command handler with a started manager.
+
+    MessageBus dispatches inline, so the handler is registered by the time
+    ``publish`` returns and no wait is needed before sending tasks.
+    """
+    bus.publish("commands.register", {"command": command, "handler": handler})
+
+
+def _join_registration(manager, timeout=2.0):
+    """Wait for the background register_asset call, if one was started."""
+    thread = manager._registration_thread
+    if thread is not None:
+        thread.join(timeout)
+        assert not thread.is_alive()
+
+
+@pytest.mark.parametrize(
+    "methods,expected_intervals,expected_register_calls", METHOD_CASES
+)
+def test_method_change(
+    make_manager,
+    registration,
+    methods,
+    expected_intervals,
+    expected_register_calls,
+):
+    """Test interval selection per method and that registration runs once."""
+    bus, manager = make_manager(METHOD_OPS_CFG)
 
     # Initial state should use default interval
     assert manager._current_checkin_interval_s == 30.0
 
-    with patch("modules.operations.manager.register_asset", return_value=True):
-        # Change to wifi
-        manager._handle_method_changed({"method": "wifi"})
-        assert manager._current_checkin_interval_s == 1.0
-
-        # Change to meshtastic
-        manager._handle_method_changed({"method": "meshtastic"})
-        assert manager._current_checkin_interval_s == 15.0
+    for method, expected in zip(methods, expected_intervals):
+        manager._handle_method_changed({"method": method})
+        assert manager._current_checkin_interval_s == expected
 
-        # Change to unknown method (should use default)
-        manager._handle_method_changed({"method": "unknown"})
-        assert manager._current_checkin_interval_s == 30.0
+    # The started guard is checked synchronously, so at most one
+    # registration thread exists by now.
+    _join_registration(manager)
+    assert registration.call_count == expected_register_calls
+    assert manager._registration_started is bool(methods)
 
 
-def test_method_change_preserves_checkin_timing():
+def test_method_change_preserves_checkin_timing(make_manager, registration, clock):
     """Test that method change doesn't cause redundant check-ins."""
-    config = _base_config(
-        {
-            "enabled": True,
-            "heartbeat_interval_s": 30.0,
-            "checkin_interval_s": 30.0,
-            "checkin_interval_wifi_s": 1.0,
-            "checkin_interval_mesh_s": 15.0,
-            "checkin_payload": {"latitude": 0.0, "longitude": 0.0},
-        }
-    )
-    bus = MessageBus()
-    manager = OperationsManager(bus, config)
+    bus, manager = make_manager(METHOD_OPS_CFG)
 
-    with patch("modules.operations.manager.register_asset", return_value=True):
-        # Simulate a recent check-in on mesh (15s interval)
-        current_time = time.time()
-        manager._current_method = "meshtastic"
-        manager._current_checkin_interval_s = 15.0
-        manager._last_checkin = current_time - 5.0  # Checked in 5 seconds ago
+    # Simulate a recent check-in on mesh (15s interval)
+    manager._current_method = "meshtastic"
+    manager._current_checkin_interval_s = 15.0
+    manager._last_checkin = clock.now - 5.0  # Checked in 5 seconds ago
 
-        # Switch to wifi (1s interval)
-        # Since we're switching to a faster interval (1s) and 5s have elapsed,
-        # we should be ready to check in immediately
-        manager._handle_method_changed({"method": "wifi"})
+    # Switch to wifi (1s interval)
+    # Since we're switching to a faster interval (1s) and 5s have elapsed,
+    # we should be ready to check in immediately
+    manager._handle_method_changed({"method": "wifi"})
 
-        # The _last_checkin should be adjusted so next check-in happens immediately
-        elapsed = time.time() - manager._last_checkin
-        assert elapsed >= manager._current_checkin_interval_s
+    # The _last_checkin should be adjusted so next check-in happens immediately
+    assert manager._last_checkin == clock.now - manager._current_checkin_interval_s
 
-        # Now test the opposite: switch from fast to slow when we just checked in
-        manager._last_checkin = time.time() - 0.5  # Just checked in 0.5s ago
-        manager._current_method = "wifi"
-        manager._current_checkin_interval_s = 1.0
+    # Now test the opposite: switch from fast to slow when we just checked in
+    manager._last_checkin = clock.now - 0.5  # Just checked in 0.5s ago
+    manager._current_method = "wifi"
+    manager._current_checkin_interval_s = 1.0
 
-        # Switch to mesh (15s interval)
-        manager._handle_method_changed({"method": "meshtastic"})
+    # Switch to mesh (15s interval)
+    manager._handle_method_changed({"method": "meshtastic"})
 
-        # The _last_checkin should be preserved - we don't want immediate check-in
-        elapsed = time.time() - manager._last_checkin
-        assert elapsed < 1.0  # Should still be less than 1 second
+    # The _last_checkin should be preserved - we don't want immediate check-in
+    assert manager._last_checkin == clock.now - 0.5
 
 
-def test_method_change_ignores_duplicate_methods():
+def test_method_change_ignores_duplicate_methods(make_manager, registration):
     """Test that duplicate method change events are ignored."""
-    config = _base_config(
-        {
-            "enabled": True,
-            "heartbeat_interval_s": 30.0,
-            "checkin_interval_s": 30.0,
-            "checkin_interval_wifi_s": 1.0,
-            "checkin_interval_mesh_s": 15.0,
-            "checkin_payload": {"latitude": 0.0, "longitude": 0.0},
-        }
-    )
-    bus = MessageBus()
-    manager = OperationsManager(bus, config)
-
-    register_called = {"count": 0}
-
-    def fake_register(b, c):
-        register_called["count"] += 1
-        return True
+    bus, manager = make_manager(METHOD_OPS_CFG)
 
-    with patch("modules.operations.manager.register_asset", fake_register):
-        # First wifi change
-        manager._handle_method_changed({"method": "wifi"})
-        time.sleep(0.1)
-        assert register_called["count"] == 1
-        assert manager._current_checkin_interval_s == 1.0
+    # First wifi change
+    manager._handle_method_changed({"method": "wifi"})
+    first_thread = manager._registration_thread
+    _join_registration(manager)
+    assert registration.call_count == 1
+    assert manager._current_checkin_interval_s == 1.0
 
-        # Duplicate wifi change should be ignored
-        manager._handle_method_changed({"method": "wifi"})
-        time.sleep(0.1)
-        assert register_called["count"] == 1  # Should not increment
+    # Duplicate wifi change should be ignored
+    manager._handle_method_changed({"method": "wifi"})
+    assert manager._registration_thread is first_thread
+    assert registration.call_count == 1  # Should not increment
+    registration.assert_called_once_with(bus, manager.config)
 
 
-def test_checkin_disabled_when_interval_zero():
+def test_checkin_disabled_when_interval_zero(make_manager, registration):
     """Test that check-ins are disabled when interval is 0 or negative."""
-    config = _base_config(
-        {
-            "enabled": True,
-            "heartbeat_interval_s": 30.0,
-            "checkin_interval_s": 0,  # Disabled
-            "checkin_interval_wifi_s": 1.0,
-            "checkin_interval_mesh_s": 15.0,
-            "checkin_payload": {"latitude": 0.0, "longitude": 0.0},
-        }
-    )
-    bus = MessageBus()
-    manager = OperationsManager(bus, config)
+    bus, manager = make_manager({**METHOD_OPS_CFG, "checkin_interval_s": 0})
 
     # Default interval is 0, so checkins should be disabled
     assert manager._current_checkin_interval_s == 0
 
     # Publish events to track if check-ins happen
     checkin_requests = []
+    bus.subscribe("comms.request", checkin_requests.append)
 
-    def capture_checkin(data):
-        checkin_requests.append(data)
+    manager._registration_complete = True
 
-    bus.subscribe("comms.request", capture_checkin)
-
-    with patch("modules.operations.manager.register_asset", return_value=True):
-        manager._registration_complete = True
-        manager.start()
-
-        # Wait a bit
-        time.sleep(2)
+    # Run one loop tick on this thread; the tick's wait ends the loop.
+    def _end_tick(timeout=None):
+        manager.running = False
+        return True
 
-        # No check-ins should have been sent
-        assert len(checkin_requests) == 0
+    manager._wake.wait = _end_tick
+    manager.running = True
+    manager._loop()
 
-        manager.stop()
+    # No check-ins should have been sent
+    assert checkin_requests == []
 
 
-def test_registration_sets_completion_flag():
+def test_registration_sets_completion_flag(make_manager, registration):
     """Test that registration completion flag is set correctly."""
-    config = _base_config(
-        {
-            "enabled": True,
-            "heartbeat_interval_s": 30.0,
-            "checkin_interval_s": 30.0,
-            "checkin_interval_wifi_s": 1.0,
-            "checkin_interval_mesh_s": 15.0,
-            "checkin_payload": {"latitude": 0.0, "longitude": 0.0},
-        }
-    )
-    bus = MessageBus()
-    manager = OperationsManager(bus, config)
+    bus, manager = make_manager(METHOD_OPS_CFG)
 
     assert manager._registration_complete is False
 
-    def fake_register(b, c):
-        return True  # Success
-
-    with patch("modules.operations.manager.register_asset", fake_register):
-        manager._handle_method_changed({"method": "wifi"})
+    manager._handle_method_changed({"method": "wifi"})
 
-        # Wait for thread to complete
-        time.sleep(0.2)
+    # Registration should be complete once the thread finishes
+    _join_registration(manager)
+    assert manager._registration_complete is True
 
-        # Registration should be complete
-        assert manager._registration_complete is True
 
-
-def test_registration_handles_failure():
+def test_registration_handles_failure(make_manager, registration):
     """Test that registration failure is handled gracefully."""
-    config = _base_config(
-        {
-            "enabled": True,
-            "heartbeat_interval_s": 30.0,
-            "checkin_interval_s": 30.0,
-            "checkin_interval_wifi_s": 1.0,
-            "checkin_interval_mesh_s": 15.0,
-            "checkin_payload": {"latitude": 0.0, "longitude": 0.0},
-        }
-    )
-    bus = MessageBus()
-    manager = OperationsManager(bus, config)
-
-    def fake_register(b, c):
-        return False  # Failure
+    bus, manager = make_manager(METHOD_OPS_CFG)
 
-    with patch("modules.operations.manager.register_asset", fake_register):
-        manager._handle_method_changed({"method": "wifi"})
+    registration.return_value = False
 
-        # Wait for thread to complete
-        time.sleep(0.2)
+    manager._handle_method_changed({"method": "wifi"})
+    _join_registration(manager)
 
-        # Registration should be marked as incomplete
-        assert manager._registration_complete is False
+    # Registration should be marked as incomplete
+    assert manager._registration_complete is False
 
 
-def test_task_handling_enqueue_and_execute():
+def test_task_handling_enqueue_and_execute(make_manager):
     """Test that tasks are properly enqueued and executed."""
-    config = _base_config(
-        {
-            "enabled": True,
-            "heartbeat_interval_s": 30.0,
-            "checkin_interval_s": 30.0,
-        }
-    )
-    bus = MessageBus()
-    manager = OperationsManager(bus, config)
-    manager.start()
-
-    # Track comms requests
-    comms_requests = []
-    bus.subscribe("comms.request", lambda d: comms_requests.append(d))
+    bus, manager = make_manager(TASK_OPS_CFG, start=True)
 
     # Register a command handler
     executed_tasks = []
@@ -294,10 +274,10 @@ def test_task_handling_enqueue_and_execute():
         executed_tasks.append(params)
         return {"result": "success"}
 
-    bus.publish(
-        "commands.register", {"command": "test_command", "handler": mock_handler}
-    )
-    time.sleep(0.1)
+    _register_command(bus, "test_command", mock_handler)
+
+    # Track comms requests made for the task
+    captured = _capture(bus, "comms.request")
 
     # Simulate receiving a task from checkin response
     manager._handle_comms_response(
@@ -321,8 +301,8 @@ def test_task_handling_enqueue_and_execute():
         }
     )
 
-    # Wait for task to be executed (loop will call _maybe_dispatch_command)
-    time.sleep(1.5)
+    # Wait for acknowledge + complete (loop will call _maybe_dispatch_command)
+    comms_requests = _collect(captured, 2)
 
     # Verify handler was called
     assert len(executed_tasks) == 1
@@ -339,21 +319,10 @@ def test_task_handling_enqueue_and_execute():
     assert len(complete_requests) == 1
     assert complete_requests[0]["args"]["task_id"] == "task-123"
 
-    manager.stop()
-
 
-def test_task_handling_duplicate_filtering():
+def test_task_handling_duplicate_filtering(make_manager):
     """Test that duplicate tasks are filtered out."""
-    config = _base_config(
-        {
-            "enabled": True,
-            "heartbeat_interval_s": 30.0,
-            "checkin_interval_s": 30.0,
-        }
-    )
-    bus = MessageBus()
-    manager = OperationsManager(bus, config)
-    manager.start()
+    bus, manager = make_manager(TASK_OPS_CFG, start=True)
 
     executed_count = {"count": 0}
 
@@ -361,8 +330,8 @@ def test_task_handling_duplicate_filtering():
         executed_count["count"] += 1
         return {}
 
-    bus.publish("commands.register", {"command": "test_cmd", "handler": mock_handler})
-    time.sleep(0.1)
+    _register_command(bus, "test_cmd", mock_handler)
+    captured = _capture(bus, "comms.request")
 
     # Send same task twice
     task = {
@@ -375,44 +344,30 @@ def test_task_handling_duplicate_filtering():
         {"function": "checkin_entity", "ok": True, "result": {"tasks": [task]}}
     )
 
-    time.sleep(1.5)
+    # Wait for acknowledge + complete of the first delivery
+    _collect(captured, 2)
 
-    # Send same task again
+    # Send same task again; duplicates are dropped before queueing
     manager._handle_comms_response(
         {"function": "checkin_entity", "ok": True, "result": {"tasks": [task]}}
     )
 
-    time.sleep(1.5)
+    assert not manager._command_queue
+    assert captured.empty()
 
     # Should only execute once
     assert executed_count["count"] == 1
 
-    manager.stop()
 
-
-def test_task_handling_error_handling():
+def test_task_handling_error_handling(make_manager):
     """Test that task errors are properly reported."""
-    config = _base_config(
-        {
-            "enabled": True,
-            "heartbeat_interval_s": 30.0,
-            "checkin_interval_s": 30.0,
-        }
-    )
-    bus = MessageBus()
-    manager = OperationsManager(bus, config)
-    manager.start()
-
-    comms_requests = []
-    bus.subscribe("comms.request", lambda d: comms_requests.append(d))
+    bus, manager = make_manager(TASK_OPS_CFG, start=True)
 
     def failing_handler(params):
         raise ValueError("Test error")
 
-    bus.publish(
-        "commands.register", {"command": "fail_cmd", "handler": failing_handler}
-    )
-    time.sleep(0.1)
+    _register_command(bus, "fail_cmd", failing_handler)
+    captured = _capture(bus, "comms.request")
 
     manager._handle_comms_response(
         {
@@ -430,7 +385,8 @@ def test_task_handling_error_handling():
         }
     )
 
-    time.sleep(1.5)
+    # Wait for acknowledge + fail
+    comms_requests = _collect(captured, 2)
 
     # Verify fail_task was called
     fail_requests = [r for r in comms_requests if r.get("function") == "fail_task"]
@@ -438,25 +394,13 @@ def test_task_handling_error_handling():
     assert fail_requests[0]["args"]["task_id"] == "task-789"
     assert "Test error" in fail_requests[0]["args"]["error_message"]
 
-    manager.stop()
 
-
-def test_track_broadcasting_distance_throttling():
+def test_track_broadcasting_distance_throttling(make_manager, clock):
     """Test that track updates are throttled based on distance."""
-    config = _base_config(
-        {
-            "enabled": True,
-            "heartbeat_interval_s": 30.0,
-            "checkin_interval_s": 30.0,
-            "track_update_min_distance_m": 100.0,
-            "track_update_min_seconds": 0.5,  # Use shorter time for test
-        }
-    )
-    bus = MessageBus()
-    manager = OperationsManager(bus, config)
+    bus, manager = make_manager(TRACK_OPS_CFG)
 
     comms_requests = []
-    bus.subscribe("comms.request", lambda d: comms_requests.append(d))
+    bus.subscribe("comms.request", comms_requests.append)
 
     # First track update - should broadcast
     manager._handle_data_store_snapshot(
@@ -466,14 +410,14 @@ def test_track_broadcasting_distance_throttling():
                 "tracks": {
                     "track-1": {
                         "value": {"latitude": 40.0, "longitude": -74.0},
-                        "updated_at": time.time(),
+                        "updated_at": clock.now,
                     }
                 }
             },
         }
     )
 
-    time.sleep(0.6)  # Wait for time threshold
+    clock.advance(0.6)  # Past the time threshold
 
     # Second update with small distance change (< 100m) - should NOT broadcast
     manager._handle_data_store_snapshot(
@@ -483,14 +427,14 @@ def test_track_broadcasting_distance_throttling():
                 "tracks": {
                     "track-1": {
                         "value": {"latitude": 40.0001, "longitude": -74.0},
-                        "updated_at": time.time(),
+                        "updated_at": clock.now,
                     }
                 }
             },
         }
     )
 
-    time.sleep(0.6)  # Wait for time threshold
+    clock.advance(0.6)  # Past the time threshold
 
     # Third update with large distance change (> 100m) - should broadcast
     manager._handle_data_store_snapshot(
@@ -500,15 +444,13 @@ def test_track_broadcasting_distance_throttling():
                 "tracks": {
                     "track-1": {
                         "value": {"latitude": 40.001, "longitude": -74.0},
-                        "updated_at": time.time(),
+                        "updated_at": clock.now,
                     }
                 }
             },
         }
     )
 
-    time.sleep(0.1)
-
     # Count telemetry updates
     telemetry_updates = [
         r for r in comms_requests if r.get("function") == "update_telemetry"
@@ -518,22 +460,12 @@ def test_track_broadcasting_distance_throttling():
     assert len(telemetry_updates) == 2
 
 
-def test_track_broadcasting_time_throttling():
+def test_track_broadcasting_time_throttling(make_manager, clock):
     """Test that track updates are throttled based on time."""
-    config = _base_config(
-        {
-            "enabled": True,
-            "heartbeat_interval_s": 30.0,
-            "checkin_interval_s": 30.0,
-            "track_update_min_distance_m": 100.0,
-            "track_update_min_seconds": 0.5,
-        }
-    )
-    bus = MessageBus()
-    manager = OperationsManager(bus, config)
+    bus, manager = make_manager(TRACK_OPS_CFG)
 
     comms_requests = []
-    bus.subscribe("comms.request", lambda d: comms_requests.append(d))
+    bus.subscribe("comms.request", comms_requests.append)
 
     # First update
     manager._handle_data_store_snapshot(
@@ -543,14 +475,14 @@ def test_track_broadcasting_time_throttling():
                 "tracks": {
                     "track-2": {
                         "value": {"latitude": 40.0, "longitude": -74.0},
-                        "updated_at": time.time(),
+                        "updated_at": clock.now,
                     }
                 }
             },
         }
     )
 
-    time.sleep(0.1)
+    clock.advance(0.1)
 
     # Second update immediately (large distance change but too soon) - should NOT broadcast
     manager._handle_data_store_snapshot(
@@ -560,14 +492,14 @@ def test_track_broadcasting_time_throttling():
                 "tracks": {
                     "track-2": {
                         "value": {"latitude": 40.01, "longitude": -74.0},
-                        "updated_at": time.time(),
+                        "updated_at": clock.now,
                     }
                 }
             },
         }
     )
 
-    time.sleep(0.5)
+    clock.advance(0.5)
 
     # Third update after delay - should broadcast
     manager._handle_data_store_snapshot(
@@ -577,15 +509,13 @@ def test_track_broadcasting_time_throttling():
                 "tracks": {
                     "track-2": {
                         "value": {"latitude": 40.02, "longitude": -74.0},
-                        "updated_at": time.time(),
+                        "updated_at": clock.now,
                     }
                 }
             },
         }
     )
 
-    time.sleep(0.1)
-
     # Count telemetry updates
     telemetry_updates = [
         r for r in comms_requests if r.get("function") == "update_telemetry"
@@ -595,22 +525,14 @@ def test_track_broadcasting_time_throttling():
     assert len(telemetry_updates) == 2
 
 
-def test_track_broadcasting_optional_fields():
+def test_track_broadcasting_optional_fields(make_manager):
     """Test that track broadcasts include optional fields when present."""
-    config = _base_config(
-        {
-            "enabled": True,
-            "heartbeat_interval_s": 30.0,
-            "checkin_interval_s": 30.0,
-        }
-    )
-    bus = MessageBus()
-    manager = OperationsManager(bus, config)
+    bus, manager = make_manager(TASK_OPS_CFG)
 
     comms_requests = []
-    bus.subscribe("comms.request", lambda d: comms_requests.append(d))
+    bus.subscribe("comms.request", comms_requests.append)
 
-    # Track with all optional fields
+    # One track with all optional fields and one with none, in one snapshot
     manager._handle_data_store_snapshot(
         {
             "request_id": "snap-1",
@@ -625,22 +547,30 @@ def test_track_broadcasting_optional_fields():
                             "heading_deg": 270.0,
                         },
                         "updated_at": time.time(),
-                    }
+                    },
+                    "track-3-bare": {
+                        "value": {"latitude": 41.0, "longitude": -75.0},
+                        "updated_at": time.time(),
+                    },
                 }
             },
         }
     )
 
-    time.sleep(0.1)
-
-    # Verify optional fields are included
-    telemetry_updates = [
-        r for r in comms_requests if r.get("function") == "update_telemetry"
-    ]
-    assert len(telemetry_updates) == 1
+    # Verify optional fields are included only when present
+    telemetry_updates = {
+        r["args"]["entity_id"]: r["args"]
+        for r in comms_requests
+        if r.get("function") == "update_telemetry"
+    }
+    assert set(telemetry_updates) == {"track-3", "track-3-bare"}
+    assert set(telemetry_updates["track-3-bare"]) == {
+        "entity_id",
+        "latitude",
+        "longitude",
+    }
 
-    args = telemetry_updates[0]["args"]
-    assert args["entity_id"] == "track-3"
+    args = telemetry_updates["track-3"]
     assert args["latitude"] == 40.0
     assert args["longitude"] == -74.0
     assert args["altitude_m"] == 100.5
@@ -648,58 +578,42 @@ def test_track_broadcasting_optional_fields():
     assert args["heading_deg"] == 270.0
 
 
-def test_track_broadcasting_handles_invalid_data():
+def test_track_broadcasting_handles_invalid_data(make_manager):
     """Test that track broadcasting handles invalid data gracefully."""
-    config = _base_config(
-        {
-            "enabled": True,
-            "heartbeat_interval_s": 30.0,
-            "checkin_interval_s": 30.0,
-        }
-    )
-    bus = MessageBus()
-    manager = OperationsManager(bus, config)
+    bus, manager = make_manager(TASK_OPS_CFG)
 
     comms_requests = []
-    bus.subscribe("comms.request", lambda d: comms_requests.append(d))
+    bus.subscribe("comms.request", comms_requests.append)
 
     # Invalid snapshot data
     manager._handle_data_store_snapshot("invalid")
     manager._handle_data_store_snapshot({"snapshot": "invalid"})
     manager._handle_data_store_snapshot({"snapshot": {"tracks": "invalid"}})
 
-    # Missing coordinates
+    # Malformed track records, batched into one snapshot
     manager._handle_data_store_snapshot(
         {
             "request_id": "snap-1",
             "snapshot": {
                 "tracks": {
+                    # Missing longitude
                     "track-4": {
-                        "value": {"latitude": 40.0},  # Missing longitude
+                        "value": {"latitude": 40.0},
                         "updated_at": time.time(),
-                    }
-                }
-            },
-        }
-    )
-
-    # Invalid coordinate types
-    manager._handle_data_store_snapshot(
-        {
-            "request_id": "snap-2",
-            "snapshot": {
-                "tracks": {
+                    },
+                    # Invalid coordinate types
                     "track-5": {
                         "value": {"latitude": "invalid", "longitude": -74.0},
                         "updated_at": time.time(),
-                    }
+                    },
+                    # Record and value of the wrong shape
+                    "track-6": "invalid",
+                    "track-7": {"value": "invalid"},
                 }
             },
         }
     )
 
-    time.sleep(0.1)
-
     # No telemetry updates should have been sent
     telemetry_updates = [
         r for r in comms_requests if r.get("function") == "update_telemetry"
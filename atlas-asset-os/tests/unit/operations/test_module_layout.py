@@ -1,9 +1,8 @@
-from pathlib import Path
+import os.path
 
 
-def test_operations_module_layout():
-    root = Path(__file__).resolve().parents[3]
-    module_dir = root / "modules" / "operations"
+def test_operations_module_layout(asset_os_root):
+    module_dir = os.path.join(asset_os_root, "modules", "operations")
 
-    assert module_dir.is_dir()
-    assert (module_dir / "manager.py").is_file()
+    assert os.path.isdir(module_dir)
+    assert os.path.isfile(os.path.join(module_dir, "manager.py"))
@@ -1,123 +1,80 @@
 """Tests for asset registration module."""
 
-import threading
 import time
+from types import MappingProxyType, SimpleNamespace
 
+import pytest
 
 from framework.bus import MessageBus
 from modules.operations.registration import register_asset
 
 
+_ATLAS = MappingProxyType({"base_url": "http://localhost:8000", "api_token": None})
+
+
 def _base_config(asset_cfg: dict) -> dict:
     """Create a base configuration for testing."""
-    return {
-        "atlas": {
-            "base_url": "http://localhost:8000",
-            "api_token": None,
-            "asset": asset_cfg,
-        },
-    }
+    return {"atlas": {**_ATLAS, "asset": asset_cfg}}
+
 
+def _simulate_success_response(bus: MessageBus):
+    """Simulate a successful response from the comms bus.
 
-def _simulate_success_response(bus: MessageBus, delay: float = 0.1):
-    """Simulate a successful response from the comms bus."""
+    The response is published inline from the request handler; register_asset
+    sets its expected request_id before publishing, so the reply is matched
+    even though it arrives before the wait starts.
+    """
 
     def on_request(data):
         req_id = data.get("request_id") if isinstance(data, dict) else None
-
-        def send_response():
-            time.sleep(delay)
-            bus.publish(
-                "comms.response",
-                {
-                    "function": "create_entity",
-                    "request_id": req_id,
-                    "ok": True,
-                },
-            )
-
-        threading.Thread(target=send_response, daemon=True).start()
+        bus.publish(
+            "comms.response",
+            {
+                "function": "create_entity",
+                "request_id": req_id,
+                "ok": True,
+            },
+        )
 
     bus.subscribe("comms.request", on_request)
 
 
-def _simulate_error_response(
-    bus: MessageBus, error_msg: str = "Test error", delay: float = 0.1
-):
+def _simulate_error_response(bus: MessageBus, error_msg: str = "Test error"):
     """Simulate an error response from the comms bus."""
 
     def on_request(data):
         req_id = data.get("request_id") if isinstance(data, dict) else None
-
-        def send_response():
-            time.sleep(delay)
-            bus.publish(
-                "comms.response",
-                {
-                    "function": "create_entity",
-                    "request_id": req_id,
-                    "ok": False,
-                    "error": error_msg,
-                },
-            )
-
-        threading.Thread(target=send_response, daemon=True).start()
+        bus.publish(
+            "comms.response",
+            {
+                "function": "create_entity",
+                "request_id": req_id,
+                "ok": False,
+                "error": error_msg,
+            },
+        )
 
     bus.subscribe("comms.request", on_request)
 
 
-def test_register_asset_with_valid_asset_type():
-    """Test that asset registration succeeds with valid asset type."""
-    config = _base_config(
-        {
-            "id": "test-asset-001",
-            "type": "asset",
-            "name": "Test Asset",
-            "model_id": "test-model",
-        }
-    )
-    bus = MessageBus()
-    _simulate_success_response(bus)
-
-    result = register_asset(bus, config, timeout=1.0)
-    assert result is True
+@pytest.fixture
+def bus() -> MessageBus:
+    """Fresh bus per test; the simulators subscribe to it."""
+    return MessageBus()
 
 
-def test_register_asset_with_valid_track_type():
-    """Test that asset registration succeeds with track entity type."""
-    config = _base_config(
-        {
-            "id": "test-track-001",
-            "type": "track",
-            "name": "Test Track",
-            "model_id": "test-model",
-        }
+@pytest.fixture
+def backoff_sleeps(monkeypatch):
+    """Record register_asset's retry backoff instead of sleeping through it."""
+    sleeps = []
+    monkeypatch.setattr(
+        "modules.operations.registration.time",
+        SimpleNamespace(time=time.time, sleep=sleeps.append),
     )
-    bus = MessageBus()
-    _simulate_success_response(bus)
-
-    result = register_asset(bus, config, timeout=1.0)
-    assert result is True
+    return sleeps
 
 
-def test_register_asset_with_valid_geofeature_type():
-    """Test that asset registration succeeds with geofeature entity type."""
-    config = _base_config(
-        {
-            "id": "test-geofeature-001",
-            "type": "geofeature",
-            "name": "Test Geofeature",
-            "model_id": "test-model",
-        }
-    )
-    bus = MessageBus()
-    _simulate_success_response(bus)
-
-    result = register_asset(bus, config, timeout=1.0)
-    assert result is True
-
-
-def test_register_asset_with_invalid_entity_type():
+def test_register_asset_with_invalid_entity_type(bus):
     """Test that asset registration fails with invalid entity type."""
     config = _base_config(
         {
@@ -127,7 +84,6 @@ def test_register_asset_with_invalid_entity_type():
             "model_id": "test-model",
         }
     )
-    bus = MessageBus()
 
     result = register_asset(bus, config, timeout=1.0)
 
@@ -135,7 +91,7 @@ def test_register_asset_with_invalid_entity_type():
     assert result is False
 
 
-def test_register_asset_normalizes_type_to_lowercase():
+def test_register_asset_normalizes_type_to_lowercase(bus):
     """Test that entity type is normalized to lowercase."""
     config = _base_config(
         {
@@ -145,20 +101,10 @@ def test_register_asset_normalizes_type_to_lowercase():
             "model_id": "test-model",
         }
     )
-    bus = MessageBus()
 
     # Track what was published to the bus
     published_data = []
-
-    def track_publish(topic, data):
-        if topic == "comms.request":
-            published_data.append(data)
-
-    original_publish = bus.publish
-    bus.publish = lambda topic, data: (
-        track_publish(topic, data),
-        original_publish(topic, data),
-    )[1]
+    bus.subscribe("comms.request", published_data.append)
 
     _simulate_success_response(bus)
     result = register_asset(bus, config, timeout=1.0)
@@ -169,7 +115,7 @@ def test_register_asset_normalizes_type_to_lowercase():
     assert published_data[0]["args"]["entity_type"] == "asset"
 
 
-def test_register_asset_with_mixed_case_type():
+def test_register_asset_with_mixed_case_type(bus):
     """Test that mixed case entity types are normalized to lowercase."""
     config = _base_config(
         {
@@ -179,19 +125,9 @@ def test_register_asset_with_mixed_case_type():
             "model_id": "test-model",
         }
     )
-    bus = MessageBus()
 
     published_data = []
-
-    def track_publish(topic, data):
-        if topic == "comms.request":
-            published_data.append(data)
-
-    original_publish = bus.publish
-    bus.publish = lambda topic, data: (
-        track_publish(topic, data),
-        original_publish(topic, data),
-    )[1]
+    bus.subscribe("comms.request", published_data.append)
 
     _simulate_success_response(bus)
     result = register_asset(bus, config, timeout=1.0)
@@ -201,7 +137,7 @@ def test_register_asset_with_mixed_case_type():
     assert published_data[0]["args"]["entity_type"] == "track"
 
 
-def test_register_asset_defaults_to_asset_type():
+def test_register_asset_defaults_to_asset_type(bus):
     """Test that missing type defaults to 'asset'."""
     config = _base_config(
         {
@@ -210,19 +146,9 @@ def test_register_asset_defaults_to_asset_type():
             "model_id": "test-model",
         }
     )
-    bus = MessageBus()
 
     published_data = []
-
-    def track_publish(topic, data):
-        if topic == "comms.request":
-            published_data.append(data)
-
-    original_publish = bus.publish
-    bus.publish = lambda topic, data: (
-        track_publish(topic, data),
-        original_publish(topic, data),
-    )[1]
+    bus.subscribe("comms.request", published_data.append)
 
     _simulate_success_response(bus)
     result = register_asset(bus, config, timeout=1.0)
@@ -232,7 +158,7 @@ def test_register_asset_defaults_to_asset_type():
     assert published_data[0]["args"]["entity_type"] == "asset"
 
 
-def test_register_asset_fails_without_asset_id():
+def test_register_asset_fails_without_asset_id(bus):
     """Test that registration fails when asset ID is missing."""
     config = _base_config(
         {
@@ -241,27 +167,20 @@ def test_register_asset_fails_without_asset_id():
             "model_id": "test-model",
         }
     )
-    bus = MessageBus()
 
     result = register_asset(bus, config, timeout=1.0)
     assert result is False
 
 
-def test_register_asset_fails_without_asset_config():
+def test_register_asset_fails_without_asset_config(bus):
     """Test that registration fails when asset config is missing."""
-    config = {
-        "atlas": {
-            "base_url": "http://localhost:8000",
-            "api_token": None,
-        },
-    }
-    bus = MessageBus()
+    config = {"atlas": _ATLAS}
 
     result = register_asset(bus, config, timeout=1.0)
     assert result is False
 
 
-def test_register_asset_handles_error_response():
+def test_register_asset_handles_error_response(bus, backoff_sleeps):
     """Test that registration handles error responses gracefully."""
     config = _base_config(
         {
@@ -271,49 +190,48 @@ def test_register_asset_handles_error_response():
             "model_id": "test-model",
         }
     )
-    bus = MessageBus()
     _simulate_error_response(bus, "Server error")
 
     result = register_asset(bus, config, timeout=1.0)
     assert result is False
-
-
-def test_register_asset_validates_allowed_types():
+    # Every attempt was answered, so only the backoff between them remains
+    assert backoff_sleeps == [1.0, 2.0]
+
+
+@pytest.mark.parametrize(
+    "entity_type,allowed",
+    [
+        ("asset", True),
+        ("track", True),
+        ("geofeature", True),
+        ("entity", False),
+        ("sensor", False),
+        ("command", False),
+        ("object", False),
+        ("model", False),
+    ],
+)
+def test_register_asset_validates_allowed_types(bus, entity_type, allowed):
     """Test that only allowed entity types (asset, track, geofeature) pass validation."""
-    allowed_types = ["asset", "track", "geofeature"]
-    invalid_types = ["entity", "sensor", "command", "object", "model"]
-
-    for entity_type in allowed_types:
-        config = _base_config(
-            {
-                "id": f"test-{entity_type}-001",
-                "type": entity_type,
-                "name": f"Test {entity_type}",
-                "model_id": "test-model",
-            }
-        )
-        bus = MessageBus()
-        _simulate_success_response(bus)
-
-        result = register_asset(bus, config, timeout=1.0)
-        assert result is True, f"Expected {entity_type} to be allowed"
-
-    for entity_type in invalid_types:
-        config = _base_config(
-            {
-                "id": f"test-{entity_type}-001",
-                "type": entity_type,
-                "name": f"Test {entity_type}",
-                "model_id": "test-model",
-            }
-        )
-        bus = MessageBus()
+    config = _base_config(
+        {
+            "id": f"test-{entity_type}-001",
+            "type": entity_type,
+            "name": f"Test {entity_type}",
+            "model_id": "test-model",
+        }
+    )
+    requests = []
+    bus.subscribe("comms.request", requests.append)
+    _simulate_success_response(bus)
 
-        result = register_asset(bus, config, timeout=1.0)
-        assert result is False, f"Expected {entity_type} to be rejected"
+    result = register_asset(bus, config, timeout=0.01)
+    assert result is allowed
+    # Rejected types short-circuit before anything is published
+    assert len(requests) == (1 if allowed else 0)
 
 
-def test_register_asset_ignores_unrelated_request_id():
+def test_register_asset_ignores_unrelated_request_id(bus, backoff_sleeps):
     """Test that registration ignores responses with a different request_id."""
     config = _base_config(
         {
@@ -323,28 +241,23 @@ def test_register_asset_ignores_unrelated_request_id():
             "model_id": "test-model",
         }
     )
-    bus = MessageBus()
 
     # Send a response with a mismatched request_id
     def send_wrong_response(data):
         if not isinstance(data, dict) or data.get("function") != "create_entity":
             return
-
-        def respond():
-            time.sleep(0.05)
-            bus.publish(
-                "comms.response",
-                {
-                    "function": "create_entity",
-                    "request_id": "wrong-id",
-                    "ok": True,
-                },
-            )
-
-        threading.Thread(target=respond, daemon=True).start()
+        bus.publish(
+            "comms.response",
+            {
+                "function": "create_entity",
+                "request_id": "wrong-id",
+                "ok": True,
+            },
+        )
 
     bus.subscribe("comms.request", send_wrong_response)
 
-    result = register_asset(bus, config, timeout=0.5)
+    result = register_asset(bus, config, timeout=0.01)
     # Should time out because the request_id doesn't match
     assert result is False
+    assert backoff_sleeps == [1.0, 2.0]
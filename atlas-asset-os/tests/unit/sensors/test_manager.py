@@ -1,6 +1,8 @@
-import time
+import threading
+
 from framework.bus import MessageBus
 from modules.sensors.manager import SensorsManager
+from modules.sensors.workers import WORKER_REGISTRY
 from modules.sensors.workers.base import SensorWorker
 
 
@@ -18,20 +20,27 @@ class MockSensorWorker(SensorWorker):
         super().__init__(bus, device_cfg, config)
         self.run_called = False
         self.stop_called = False
+        self.started = threading.Event()
 
     def run(self):
         self.run_called = True
         # Publish one sample output
         self.publish_output({"value": 42})
+        self.started.set()
         # Then wait for stop
-        while self._running:
-            time.sleep(0.1)
+        self._stop_event.wait()
 
     def stop(self):
         self.stop_called = True
         super().stop()
 
 
+def _wait_for_workers(manager):
+    """Block until every started mock worker has entered run()."""
+    for worker in manager._workers.values():
+        assert worker.started.wait(timeout=1.0)
+
+
 def test_sensors_manager_initialization():
     """Test that sensors manager initializes correctly."""
     config = _base_config({"enabled": True, "devices": []})
@@ -80,68 +89,54 @@ def test_sensors_manager_handles_invalid_devices_config():
 
 def test_sensors_manager_starts_enabled_workers(monkeypatch):
     """Test that manager only starts enabled workers."""
-    from modules.sensors import workers
+    monkeypatch.setitem(WORKER_REGISTRY, "mock_sensor", MockSensorWorker)
 
-    # Temporarily add mock worker to registry
-    original_registry = workers.WORKER_REGISTRY.copy()
-    workers.WORKER_REGISTRY["mock_sensor"] = MockSensorWorker
-
-    try:
-        devices = [
-            {"id": "sensor1", "type": "mock_sensor", "enabled": True},
-            {"id": "sensor2", "type": "mock_sensor", "enabled": False},
-            {"id": "sensor3", "type": "mock_sensor"},  # enabled by default
-        ]
-        config = _base_config({"enabled": True, "devices": devices})
-        bus = MessageBus()
-        manager = SensorsManager(bus, config)
+    devices = [
+        {"id": "sensor1", "type": "mock_sensor", "enabled": True},
+        {"id": "sensor2", "type": "mock_sensor", "enabled": False},
+        {"id": "sensor3", "type": "mock_sensor"},  # enabled by default
+    ]
+    config = _base_config({"enabled": True, "devices": devices})
+    bus = MessageBus()
+    manager = SensorsManager(bus, config)
 
-        manager.start()
-        time.sleep(0.2)  # Let workers start
+    manager.start()
+    _wait_for_workers(manager)
 
-        # Should have started sensor1 and sensor3, but not sensor2
-        assert "sensor1" in manager._workers
-        assert "sensor2" not in manager._workers
-        assert "sensor3" in manager._workers
+    # Should have started sensor1 and sensor3, but not sensor2
+    assert "sensor1" in manager._workers
+    assert "sensor2" not in manager._workers
+    assert "sensor3" in manager._workers
 
-        # Verify workers actually ran
-        assert manager._workers["sensor1"].run_called
-        assert manager._workers["sensor3"].run_called
+    # Verify workers actually ran
+    assert manager._workers["sensor1"].run_called
+    assert manager._workers["sensor3"].run_called
 
-        manager.stop()
-    finally:
-        # Restore original registry
-        workers.WORKER_REGISTRY = original_registry
+    manager.stop()
 
 
 def test_sensors_manager_skips_invalid_device_configs(monkeypatch):
     """Test that manager skips invalid device configurations."""
-    from modules.sensors import workers
+    monkeypatch.setitem(WORKER_REGISTRY, "mock_sensor", MockSensorWorker)
 
-    original_registry = workers.WORKER_REGISTRY.copy()
-    workers.WORKER_REGISTRY["mock_sensor"] = MockSensorWorker
-
-    try:
-        devices = [
-            "not-a-dict",
-            {"type": "mock_sensor"},  # missing id
-            {"id": "sensor2"},  # missing type
-            {"id": "sensor3", "type": "mock_sensor", "enabled": True},  # valid
-        ]
-        config = _base_config({"enabled": True, "devices": devices})
-        bus = MessageBus()
-        manager = SensorsManager(bus, config)
+    devices = [
+        "not-a-dict",
+        {"type": "mock_sensor"},  # missing id
+        {"id": "sensor2"},  # missing type
+        {"id": "sensor3", "type": "mock_sensor", "enabled": True},  # valid
+    ]
+    config = _base_config({"enabled": True, "devices": devices})
+    bus = MessageBus()
+    manager = SensorsManager(bus, config)
 
-        manager.start()
-        time.sleep(0.2)
+    manager.start()
+    _wait_for_workers(manager)
 
-        # Should only have started sensor3
-        assert len(manager._workers) == 1
-        assert "sensor3" in manager._workers
+    # Should only have started sensor3
+    assert len(manager._workers) == 1
+    assert "sensor3" in manager._workers
 
-        manager.stop()
-    finally:
-        workers.WORKER_REGISTRY = original_registry
+    manager.stop()
 
 
 def test_sensors_manager_handles_unknown_sensor_type():
@@ -154,7 +149,6 @@ def test_sensors_manager_handles_unknown_sensor_type():
     manager = SensorsManager(bus, config)
 
     manager.start()
-    time.sleep(0.1)
 
     # Should not have started any workers
     assert len(manager._workers) == 0
@@ -164,45 +158,38 @@ def test_sensors_manager_handles_unknown_sensor_type():
 
 def test_sensors_manager_stops_all_workers(monkeypatch):
     """Test that manager stops all workers on stop."""
-    from modules.sensors import workers
+    monkeypatch.setitem(WORKER_REGISTRY, "mock_sensor", MockSensorWorker)
 
-    original_registry = workers.WORKER_REGISTRY.copy()
-    workers.WORKER_REGISTRY["mock_sensor"] = MockSensorWorker
-
-    try:
-        devices = [
-            {"id": "sensor1", "type": "mock_sensor", "enabled": True},
-            {"id": "sensor2", "type": "mock_sensor", "enabled": True},
-        ]
-        config = _base_config({"enabled": True, "devices": devices})
-        bus = MessageBus()
-        manager = SensorsManager(bus, config)
+    devices = [
+        {"id": "sensor1", "type": "mock_sensor", "enabled": True},
+        {"id": "sensor2", "type": "mock_sensor", "enabled": True},
+    ]
+    config = _base_config({"enabled": True, "devices": devices})
+    bus = MessageBus()
+    manager = SensorsManager(bus, config)
 
-        manager.start()
-        time.sleep(0.2)
+    manager.start()
+    _wait_for_workers(manager)
 
-        # Verify workers are running
-        assert manager._workers["sensor1"]._running
-        assert manager._workers["sensor2"]._running
+    # Verify workers are running
+    assert manager._workers["sensor1"]._running
+    assert manager._workers["sensor2"]._running
 
-        # Keep references to workers before stop clears them
-        worker1 = manager._workers["sensor1"]
-        worker2 = manager._workers["sensor2"]
+    # Keep references to workers before stop clears them
+    worker1 = manager._workers["sensor1"]
+    worker2 = manager._workers["sensor2"]
 
-        # Stop manager
-        manager.stop()
-        time.sleep(0.1)
+    # Stop manager
+    manager.stop()
 
-        # Verify all workers were stopped
-        assert worker1.stop_called
-        assert worker2.stop_called
-        assert not worker1._running
-        assert not worker2._running
+    # Verify all workers were stopped
+    assert worker1.stop_called
+    assert worker2.stop_called
+    assert not worker1._running
+    assert not worker2._running
 
-        # Workers should be cleared from manager
-        assert len(manager._workers) == 0
-    finally:
-        workers.WORKER_REGISTRY = original_registry
+    # Workers should be cleared from manager
+    assert len(manager._workers) == 0
 
 
 def test_sensor_worker_publishes_output():
@@ -239,15 +226,13 @@ def test_sensor_worker_lifecycle():
 
     # Start worker
     worker.start()
-    time.sleep(0.1)
 
     assert worker._running is True
     assert worker._thread is not None
     assert worker._thread.is_alive()
 
-    # Stop worker
+    # Stop worker; stop() joins the thread
     worker.stop()
-    time.sleep(0.1)
 
     assert worker._running is False
     assert not worker._thread.is_alive()
@@ -260,12 +245,10 @@ def test_sensor_worker_prevents_double_start():
     worker = SensorWorker(bus, device_cfg, {})
 
     worker.start()
-    time.sleep(0.1)
     first_thread = worker._thread
 
     # Try to start again
     worker.start()
-    time.sleep(0.1)
 
     # Should still have the same thread
     assert worker._thread is first_thread
@@ -275,214 +258,166 @@ def test_sensor_worker_prevents_double_start():
 
 def test_device_command_registration(monkeypatch):
     """Test that device commands are registered correctly."""
-    from modules.sensors import workers
-
-    # Temporarily add mock worker to registry
-    original_registry = workers.WORKER_REGISTRY.copy()
-    workers.WORKER_REGISTRY["mock"] = MockSensorWorker
-
-    try:
-        config = _base_config(
-            {
-                "enabled": True,
-                "devices": [
-                    {
-                        "id": "sensor-1",
-                        "type": "mock",
-                        "commands": ["take_photo", "set_mode"],
-                    }
-                ],
-            }
-        )
-        bus = MessageBus()
-        manager = SensorsManager(bus, config)
-
-        # Track command registrations
-        registered_commands = []
-        bus.subscribe("commands.register", lambda d: registered_commands.append(d))
-
-        manager.start()
-        time.sleep(0.1)
-
-        # Verify commands were registered
-        assert len(registered_commands) == 2
-        command_names = {c["command"] for c in registered_commands}
-        assert command_names == {"take_photo", "set_mode"}
-
-        # Verify handlers are callable
-        for cmd in registered_commands:
-            assert callable(cmd["handler"])
-
-        manager.stop()
-    finally:
-        workers.WORKER_REGISTRY.clear()
-        workers.WORKER_REGISTRY.update(original_registry)
+    monkeypatch.setitem(WORKER_REGISTRY, "mock", MockSensorWorker)
+
+    config = _base_config(
+        {
+            "enabled": True,
+            "devices": [
+                {
+                    "id": "sensor-1",
+                    "type": "mock",
+                    "commands": ["take_photo", "set_mode"],
+                }
+            ],
+        }
+    )
+    bus = MessageBus()
+    manager = SensorsManager(bus, config)
 
+    # Track command registrations
+    registered_commands = []
+    bus.subscribe("commands.register", lambda d: registered_commands.append(d))
 
-def test_device_command_handler_invocation(monkeypatch):
-    """Test that command handlers publish sensor commands correctly."""
-    from modules.sensors import workers
+    manager.start()
 
-    # Temporarily add mock worker to registry
-    original_registry = workers.WORKER_REGISTRY.copy()
-    workers.WORKER_REGISTRY["mock"] = MockSensorWorker
+    # Verify commands were registered
+    assert len(registered_commands) == 2
+    command_names = {c["command"] for c in registered_commands}
+    assert command_names == {"take_photo", "set_mode"}
 
-    try:
-        config = _base_config(
-            {
-                "enabled": True,
-                "devices": [
-                    {"id": "sensor-1", "type": "mock", "commands": ["take_photo"]}
-                ],
-            }
-        )
-        bus = MessageBus()
-        manager = SensorsManager(bus, config)
+    # Verify handlers are callable
+    for cmd in registered_commands:
+        assert callable(cmd["handler"])
 
-        # Track sensor commands
-        sensor_commands = []
-        bus.subscribe("sensor.command", lambda d: sensor_commands.append(d))
+    manager.stop()
 
-        # Track registered handlers
-        registered_handlers = []
-        bus.subscribe("commands.register", lambda d: registered_handlers.append(d))
 
-        manager.start()
-        time.sleep(0.1)
+def test_device_command_handler_invocation(monkeypatch):
+    """Test that command handlers publish sensor commands correctly."""
+    monkeypatch.setitem(WORKER_REGISTRY, "mock", MockSensorWorker)
+
+    config = _base_config(
+        {
+            "enabled": True,
+            "devices": [
+                {"id": "sensor-1", "type": "mock", "commands": ["take_photo"]}
+            ],
+        }
+    )
+    bus = MessageBus()
+    manager = SensorsManager(bus, config)
 
-        # Invoke the handler
-        handler = registered_handlers[0]["handler"]
-        result = handler({"param1": "value1"})
+    # Track sensor commands
+    sensor_commands = []
+    bus.subscribe("sensor.command", lambda d: sensor_commands.append(d))
 
-        time.sleep(0.1)
+    # Track registered handlers
+    registered_handlers = []
+    bus.subscribe("commands.register", lambda d: registered_handlers.append(d))
 
-        # Verify sensor command was published
-        assert len(sensor_commands) == 1
-        assert sensor_commands[0]["sensor_id"] == "sensor-1"
-        assert sensor_commands[0]["command"] == "take_photo"
-        assert sensor_commands[0]["parameters"]["param1"] == "value1"
+    manager.start()
+
+    # Invoke the handler
+    handler = registered_handlers[0]["handler"]
+    result = handler({"param1": "value1"})
 
-        # Verify handler returned success
-        assert result["status"] == "sent"
+    # Verify sensor command was published
+    assert len(sensor_commands) == 1
+    assert sensor_commands[0]["sensor_id"] == "sensor-1"
+    assert sensor_commands[0]["command"] == "take_photo"
+    assert sensor_commands[0]["parameters"]["param1"] == "value1"
 
-        manager.stop()
-    finally:
-        workers.WORKER_REGISTRY.clear()
-        workers.WORKER_REGISTRY.update(original_registry)
+    # Verify handler returned success
+    assert result["status"] == "sent"
+
+    manager.stop()
 
 
 def test_device_command_unregistration(monkeypatch):
     """Test that device commands are unregistered on stop."""
-    from modules.sensors import workers
-
-    # Temporarily add mock worker to registry
-    original_registry = workers.WORKER_REGISTRY.copy()
-    workers.WORKER_REGISTRY["mock"] = MockSensorWorker
-
-    try:
-        config = _base_config(
-            {
-                "enabled": True,
-                "devices": [
-                    {"id": "sensor-1", "type": "mock", "commands": ["cmd1", "cmd2"]}
-                ],
-            }
-        )
-        bus = MessageBus()
-        manager = SensorsManager(bus, config)
-
-        # Track unregistrations
-        unregistered_commands = []
-        bus.subscribe("commands.unregister", lambda d: unregistered_commands.append(d))
-
-        manager.start()
-        time.sleep(0.1)
-
-        manager.stop()
-        time.sleep(0.1)
-
-        # Verify commands were unregistered
-        assert len(unregistered_commands) == 2
-        unregistered_names = {c["command"] for c in unregistered_commands}
-        assert unregistered_names == {"cmd1", "cmd2"}
-    finally:
-        workers.WORKER_REGISTRY.clear()
-        workers.WORKER_REGISTRY.update(original_registry)
+    monkeypatch.setitem(WORKER_REGISTRY, "mock", MockSensorWorker)
+
+    config = _base_config(
+        {
+            "enabled": True,
+            "devices": [
+                {"id": "sensor-1", "type": "mock", "commands": ["cmd1", "cmd2"]}
+            ],
+        }
+    )
+    bus = MessageBus()
+    manager = SensorsManager(bus, config)
+
+    # Track unregistrations
+    unregistered_commands = []
+    bus.subscribe("commands.unregister", lambda d: unregistered_commands.append(d))
+
+    manager.start()
+
+    manager.stop()
+
+    # Verify commands were unregistered
+    assert len(unregistered_commands) == 2
+    unregistered_names = {c["command"] for c in unregistered_commands}
+    assert unregistered_names == {"cmd1", "cmd2"}
 
 
 def test_device_command_registration_with_no_commands(monkeypatch):
     """Test that devices without commands don't cause issues."""
-    from modules.sensors import workers
-
-    # Temporarily add mock worker to registry
-    original_registry = workers.WORKER_REGISTRY.copy()
-    workers.WORKER_REGISTRY["mock"] = MockSensorWorker
-
-    try:
-        config = _base_config(
-            {
-                "enabled": True,
-                "devices": [
-                    {
-                        "id": "sensor-1",
-                        "type": "mock",
-                        # No commands specified
-                    }
-                ],
-            }
-        )
-        bus = MessageBus()
-        manager = SensorsManager(bus, config)
-
-        registered_commands = []
-        bus.subscribe("commands.register", lambda d: registered_commands.append(d))
-
-        manager.start()
-        time.sleep(0.1)
-
-        # No commands should be registered
-        assert len(registered_commands) == 0
-
-        manager.stop()
-    finally:
-        workers.WORKER_REGISTRY.clear()
-        workers.WORKER_REGISTRY.update(original_registry)
+    monkeypatch.setitem(WORKER_REGISTRY, "mock", MockSensorWorker)
+
+    config = _base_config(
+        {
+            "enabled": True,
+            "devices": [
+                {
+                    "id": "sensor-1",
+                    "type": "mock",
+                    # No commands specified
+                }
+            ],
+        }
+    )
+    bus = MessageBus()
+    manager = SensorsManager(bus, config)
+
+    registered_commands = []
+    bus.subscribe("commands.register", lambda d: registered_commands.append(d))
+
+    manager.start()
+
+    # No commands should be registered
+    assert len(registered_commands) == 0
+
+    manager.stop()
 
 
 def test_device_command_registration_with_invalid_commands(monkeypatch):
     """Test that invalid command configurations are handled gracefully."""
-    from modules.sensors import workers
-
-    # Temporarily add mock worker to registry
-    original_registry = workers.WORKER_REGISTRY.copy()
-    workers.WORKER_REGISTRY["mock"] = MockSensorWorker
-
-    try:
-        config = _base_config(
-            {
-                "enabled": True,
-                "devices": [
-                    {
-                        "id": "sensor-1",
-                        "type": "mock",
-                        "commands": "invalid",  # Should be a list
-                    }
-                ],
-            }
-        )
-        bus = MessageBus()
-        manager = SensorsManager(bus, config)
-
-        registered_commands = []
-        bus.subscribe("commands.register", lambda d: registered_commands.append(d))
-
-        manager.start()
-        time.sleep(0.1)
-
-        # No commands should be registered
-        assert len(registered_commands) == 0
-
-        manager.stop()
-    finally:
-        workers.WORKER_REGISTRY.clear()
-        workers.WORKER_REGISTRY.update(original_registry)
+    monkeypatch.setitem(WORKER_REGISTRY, "mock", MockSensorWorker)
+
+    config = _base_config(
+        {
+            "enabled": True,
+            "devices": [
+                {
+                    "id": "sensor-1",
+                    "type": "mock",
+                    "commands": "invalid",  # Should be a list
+                }
+            ],
+        }
+    )
+    bus = MessageBus()
+    manager = SensorsManager(bus, config)
+
+    registered_commands = []
+    bus.subscribe("commands.register", lambda d: registered_commands.append(d))
+
+    manager.start()
+
+    # No commands should be registered
+    assert len(registered_commands) == 0
+
+    manager.stop()
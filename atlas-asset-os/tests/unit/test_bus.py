@@ -1,14 +1,6 @@
 """Unit tests for the central MessageBus."""
 
-import sys
-from pathlib import Path
-
-# Add framework to path
-_FRAMEWORK_DIR = Path(__file__).resolve().parents[3] / "framework"
-if str(_FRAMEWORK_DIR) not in sys.path:
-    sys.path.insert(0, str(_FRAMEWORK_DIR))
-
-from framework.bus import MessageBus  # noqa: E402
+from framework.bus import MessageBus
 
 
 def test_bus_initialization():
@@ -39,8 +31,8 @@ def test_bus_multiple_subscribers():
     received_a = []
     received_b = []
 
-    bus.subscribe("test.topic", lambda d: received_a.append(d))
-    bus.subscribe("test.topic", lambda d: received_b.append(d))
+    bus.subscribe("test.topic", received_a.append)
+    bus.subscribe("test.topic", received_b.append)
 
     bus.publish("test.topic", "hello")
 
@@ -72,7 +64,7 @@ def test_bus_publish_not_running():
     """Verify that publishing does nothing if the bus is not running."""
     bus = MessageBus()
     received_data = []
-    bus.subscribe("test", lambda d: received_data.append(d))
+    bus.subscribe("test", received_data.append)
 
     bus.shutdown()
     bus.publish("test", "data")
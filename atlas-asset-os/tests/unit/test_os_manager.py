@@ -13,6 +13,7 @@ _ASSET_OS_ROOT_STR = str(_ASSET_OS_ROOT.resolve())
 if _ASSET_OS_ROOT_STR not in sys.path:
     sys.path.insert(0, _ASSET_OS_ROOT_STR)
 
+import framework.master as master  # noqa: E402
 from framework.master import OSManager  # noqa: E402
 
 # Hardcoded test config
@@ -66,3 +67,16 @@ class TestOSManager:
         # to avoid "Exception ignored in thread" warnings during test cleanup
         os_manager.shutdown()
         assert os_manager.running is False
+
+    def test_atexit_teardown_does_not_exit(self, os_manager, monkeypatch):
+        """The atexit hook stops the OS without raising SystemExit."""
+        registered = []
+        monkeypatch.setattr(master.atexit, "register", registered.append)
+        monkeypatch.setattr(master, "is_test_env", lambda: False)
+
+        os_manager.boot()
+        assert registered == [os_manager._teardown]
+
+        # Runs on the main thread outside a test env, where shutdown() exits
+        registered[0]()
+        assert os_manager.running is False